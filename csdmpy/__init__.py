@@ -273,6 +273,9 @@ def plot(csdm_object, reverse_axis=None, range=None, **kwargs):
             - The 2D{3} pixel dataset use the plt.imshow(), assuming the pixel dataset
               as an RGB image.
 
+            The keyword `disp_skip=n` draws the figure only on every n-th call for the
+            same figure, which is useful for updating a preview within a loop.
+
     Returns:
         A matplotlib figure instance.
 
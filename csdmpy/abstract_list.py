@@ -1,7 +1,5 @@
 from collections.abc import MutableSequence
 
-import numpy as np
-
 from .dependent_variable import DependentVariable
 from .dimension import Dimension
 from .dimension import LabeledDimension
@@ -19,6 +17,8 @@ __dimensions_list__ = (Dimension, LinearDimension, MonotonicDimension, LabeledDi
 class AbstractList(MutableSequence):
     """Abstract list for objects"""
 
+    __slots__ = ("_list",)
+
     def __init__(self, data=[]):
         """Store data list"""
         super().__init__()
@@ -41,6 +41,10 @@ class AbstractList(MutableSequence):
         """Get a list item"""
         return self._list[index]
 
+    def __iter__(self):
+        """Iterate over the list items"""
+        return iter(self._list)
+
     def __delitem__(self, index):
         raise LookupError("Deleting items is not allowed.")
 
@@ -55,6 +59,14 @@ class AbstractList(MutableSequence):
         """Append a list item"""
         self._list.append(self.check_object(value))
 
+    def extend(self, values):
+        """Extend the list with validated items"""
+        self._list.extend([self.check_object(item) for item in values])
+
+    def _append_unchecked(self, value):
+        """Append a list item that is already validated by the caller"""
+        self._list.append(value)
+
     def __setitem__(self, index, item):
         """Set item at index"""
         self._list.__setitem__(index, self.check_object(item))
@@ -63,16 +75,16 @@ class AbstractList(MutableSequence):
         """Check equality of DependentVariableList."""
         if not isinstance(other, self.__class__):
             return False
-        if len(self._list) != len(other._list):
-            return False
-
-        check = [self_i == other_i for self_i, other_i in zip(self._list, other._list)]
-        return np.all(check)
+        return len(self._list) == len(other._list) and all(
+            self_i == other_i for self_i, other_i in zip(self._list, other._list)
+        )
 
 
 class DimensionList(AbstractList):
     """List of Dimension objects"""
 
+    __slots__ = ()
+
     def check_object(self, obj):
         """Validate dimension"""
         if isinstance(obj, dict):
@@ -86,6 +98,8 @@ class DimensionList(AbstractList):
 class DependentVariableList(AbstractList):
     """List of Dependent variable objects"""
 
+    __slots__ = ()
+
     def check_object(self, obj):
         """Validate dependent variable"""
         if isinstance(obj, dict):
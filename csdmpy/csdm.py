@@ -1,9 +1,12 @@
 """THE CSDM object"""
 import datetime
+import functools
 import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
+import numexpr as ne
 import numpy as np
 from astropy.units.quantity import Quantity
 
@@ -35,8 +38,18 @@ from .utils import np_check_for_out
 from .utils import np_check_pads
 from .utils import validate
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = ["CSDM"]
 
+# numexpr evaluates the unit-scaled in-place add/subtract as a single multithreaded
+# pass. The thread pool overhead only pays off for large arrays.
+_NUMEXPR_DTYPES = (np.dtype("float64"), np.dtype("complex128"))
+_NUMEXPR_MIN_SIZE = 2**20
+
 
 class CSDM:
     """Create an instance of a CSDM class.
@@ -85,8 +98,6 @@ class CSDM:
         self._application = None
         self._filename = filename
 
-        kwargs_keys = kwargs.keys()
-
         _ = [
             setattr(self, f"_{k}", v)
             for k, v in kwargs.items()
@@ -94,17 +105,17 @@ class CSDM:
         ]
 
         self._dimensions = DimensionList([])
-        if "dimensions" in kwargs_keys:
+        if "dimensions" in kwargs:
             if not isinstance(kwargs["dimensions"], (list, DimensionList)):
                 dim_type = type(kwargs["dimensions"])
                 raise ValueError(
                     "A list of valid Dimension or equivalent dictionary objects is "
                     f"required, found {dim_type}."
                 )
-            _ = [self.dimensions.append(item) for item in kwargs["dimensions"]]
+            self._dimensions.extend(kwargs["dimensions"])
 
         self._dependent_variables = DependentVariableList([])
-        if "dependent_variables" in kwargs_keys:
+        if "dependent_variables" in kwargs:
             dv_type = type(kwargs["dependent_variables"])
             if not isinstance(
                 kwargs["dependent_variables"], (list, DependentVariableList)
@@ -113,12 +124,13 @@ class CSDM:
                     "A list of valid DependentVariable or equivalent dictionary "
                     f"objects is required, found {dv_type}."
                 )
+            # the dimensions are fixed at this point, evaluate the shape only once.
+            shape = self.shape[::-1]
             for item in kwargs["dependent_variables"]:
                 if isinstance(item, dict):
                     item.update({"filename": self.filename})
                 self.dependent_variables.append(item)
-                if self.shape != ():
-                    shape = self.shape[::-1]
+                if shape != ():
                     self.dependent_variables[-1]._reshape(shape)
 
     def __repr__(self):
@@ -175,7 +187,9 @@ class CSDM:
         dimensionality.
         """
         for v_1, v_2 in zip(self.dependent_variables, other.dependent_variables):
-            if v_1.unit.physical_type != v_2.unit.physical_type:
+            if v_1.unit is v_2.unit:
+                continue
+            if _physical_type(v_1.unit) != _physical_type(v_2.unit):
                 raise Exception(
                     "Cannot operate on dependent variables with physical types: "
                     f"{v_1.unit.physical_type} and {v_2.unit.physical_type}."
@@ -194,23 +208,35 @@ class CSDM:
         self.__check_dependent_variable_len_equality(other)
         self.__check_dependent_variable_dimensionality(other)
 
+    def __unit_conversion_factors(self, other):
+        """Return a list of factors converting the unit of each dependent variable
+        of the other csdm object to the unit of the corresponding dependent variable
+        of this object. The unit conversion is skipped for identical units.
+        """
+        return [
+            1.0 if v_2.unit is v_1.unit else _unit_to_factor(v_2.unit, v_1.unit)
+            for v_1, v_2 in zip(self.dependent_variables, other.dependent_variables)
+        ]
+
     def __eq__(self, other):
         """Check the other object is a CSDM object with identical attribute values.
         This does not check for the timestamp attribute."""
         if not isinstance(other, CSDM):
             return False
-        check = [
-            self.dimensions == other.dimensions,
-            self.dependent_variables == other.dependent_variables,
-            self.tags == other.tags,
-            self.read_only == other.read_only,
-            self.version == other.version,
-            # self.timestamp == other.timestamp,
-            self.geographic_coordinate == other.geographic_coordinate,
-            self.description == other.description,
-            self.application == other.application,
-        ]
-        return np.all(check)
+        # compare the cheap metadata first, and the dimensions and dependent
+        # variables (full array comparison) only when the metadata is identical.
+        keys = (
+            "version",
+            "read_only",
+            "tags",
+            "description",
+            "application",
+            "geographic_coordinate",
+            # "timestamp",
+            "dimensions",
+            "dependent_variables",
+        )
+        return all(getattr(self, k) == getattr(other, k) for k in keys)
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -258,63 +284,84 @@ class CSDM:
         if isinstance(other, CSDM):
             self.__check_csdm_object_additive_compatibility(other)
 
-            for i, item in enumerate(self.dependent_variables):
-                factor = other.dependent_variables[i].unit.to(item.unit)
-                f_n = getattr(item.components, function)
-                f_n(factor * other.dependent_variables[i].components)
+            # scratch buffer for the unit-scaled operand, reused across the
+            # dependent variables with identical shape and dtype.
+            scratch = None
+            factors = self.__unit_conversion_factors(other)
+            variables = zip(self._dependent_variables, other._dependent_variables)
+            for (item, other_item), factor in zip(variables, factors):
+                components = other_item.components
+                out = item.components
+                if factor != 1.0:
+                    if _numexpr_scaled_update(out, components, factor, symbol):
+                        continue
+                    dtype = np.result_type(components, factor)
+                    scratch = _get_buffer(scratch, components.shape, dtype)
+                    components = np.multiply(components, factor, out=scratch)
+                f_n = getattr(out, function)
+                f_n(components)
             return self
 
         other = check_scalar_object(other, symbol)
 
-        for i, item in enumerate(self.dependent_variables):
+        if not isinstance(other, Quantity):
+            for item in self._dependent_variables:
+                getattr(item.components, function)(other)
+            return self
+
+        for item in self._dependent_variables:
             f_n = getattr(item.components, function)
-            if not isinstance(other, Quantity):
-                f_n(other)
-            else:
-                factor = other.unit.to(item.unit)
-                f_n(factor * other.value)
+            f_n(_quantity_value_in_unit(other, item.unit))
         return self
 
-    def _default_addition_(self, other, f_n, operation):
+    def _default_addition_(self, other, func, operation):
         """Operate on two objects (z=x+/-y), if the other object is a
             1) csdm or scalar object,
             2) with identical dimension objects,
             3) same number of dependent-variables, and
             4) each dependent variables with identical dimensionality.
 
+        The operation is applied to the components of the copied object in-place,
+        unless the result requires a different numeric type.
+
         Args:
             other: the object to add/subtract
-            f_n: addition/subtraction function
+            func: addition/subtraction ufunc, np.add or np.subtract
             operation: "+" or "-"
         """
         if isinstance(other, CSDM):
             self.__check_csdm_object_additive_compatibility(other)
 
-            obj = self.copy()
-            for i, item in enumerate(obj.dependent_variables):
-                factor = other.dependent_variables[i].unit.to(item.unit)
-                item.components = item.components + f_n(
-                    factor, other.dependent_variables[i].components
-                )
+            factors = self.__unit_conversion_factors(other)
+            obj = self._copy_for_arithmetic()
+            variables = zip(obj._dependent_variables, other._dependent_variables)
+            for (item, other_item), factor in zip(variables, factors):
+                components = other_item.components
+                # integer components are always scaled, so that the result of two
+                # integer csdm objects stays a float array.
+                if factor != 1.0 or components.dtype.kind in "biu":
+                    components = factor * components
+                _apply_to_components(func, item, components)
             return obj
 
         other = check_scalar_object(other, operation)
-        obj = self.copy()
-        for i, item in enumerate(obj.dependent_variables):
-            item.components = (
-                item.components + f_n(1, other)
-                if not isinstance(other, Quantity)
-                else item.components + f_n(1, other.unit.to(item.unit) * other.value)
-            )
+        if func is np.subtract:
+            # add the negated scalar, so that unsigned components are promoted to a
+            # signed type rather than wrapping around.
+            func, other = np.add, -other
+        obj = self._copy_for_arithmetic()
+        if not isinstance(other, Quantity):
+            for item in obj._dependent_variables:
+                _apply_to_components(func, item, other)
+            return obj
+
+        for item in obj._dependent_variables:
+            _apply_to_components(func, item, _quantity_value_in_unit(other, item.unit))
         return obj
 
     def __add__(self, other):
         """Add two objects (z=x+y)"""
-
-        def function(val_1, val_2):
-            return val_1 * val_2
-
-        return self._default_addition_(other, function, "+")
+        return self._default_addition_(other, np.add, "+")
 
     def __radd__(self, other):
         """Right add two objects. See __add__ for details."""
@@ -326,15 +373,21 @@ class CSDM:
 
     def __sub__(self, other):
         """Subtract two objects (z=x+y)"""
-
-        def function(val_1, val_2):
-            return -val_1 * val_2
-
-        return self._default_addition_(other, function, "-")
+        return self._default_addition_(other, np.subtract, "-")
 
     def __rsub__(self, other):
         """Right subtract two objects. See __sub__ for details."""
-        return -self.__sub__(other)
+        obj = self.__sub__(other)
+        variables = obj._dependent_variables
+        # integer components are negated through the ufunc, which promotes them to
+        # float, as -csdm does.
+        if any(item.components.dtype.kind not in "fc" for item in variables):
+            return -obj
+        # negate the difference in-place rather than allocating a second object.
+        for item in variables:
+            components = item.components
+            np.negative(components, out=components)
+        return obj
 
     def __isub__(self, other):
         """Subtract two objects in-lace (y-=x). See __sub__ for details."""
@@ -344,15 +397,21 @@ class CSDM:
         """Multiply the components of the CSDM object by a scalar."""
         other = check_scalar_object(other, "*")
 
-        obj = self.copy()
-        for item in obj.dependent_variables:
-            if not isinstance(other, Quantity):
-                item.components = item.components * other
-            else:
-                value = 1 * item.subtype._unit * other
-                item.subtype._unit = value.unit
-                item.components = item.components * value.value
-        return obj
+        return self._copy_for_arithmetic()._multiply_components(other)
+
+    def _multiply_components(self, other):
+        """Multiply the components of this object by a scalar in-place, unless the
+        result requires a different numeric type."""
+        if not isinstance(other, Quantity):
+            for item in self._dependent_variables:
+                _apply_to_components(np.multiply, item, other)
+            return self
+
+        for item in self._dependent_variables:
+            value = 1 * item.subtype._unit * other
+            item.subtype._unit = value.unit
+            _apply_to_components(np.multiply, item, value.value)
+        return self
 
     def __rmul__(self, other):
         """Right multiply the components of the CSDM object by a scalar."""
@@ -363,44 +422,55 @@ class CSDM:
 
         other = check_scalar_object(other, "*")
 
-        for item in self.dependent_variables:
-            if not isinstance(other, Quantity):
-                item.components *= other
-            else:
-                value = 1 * item.subtype._unit * other
-                item.subtype._unit = value.unit
-                item.components.__imul__(value.value)
+        if not isinstance(other, Quantity):
+            for item in self._dependent_variables:
+                components = item.components
+                np.multiply(components, other, out=components)
+            return self
+
+        for item in self._dependent_variables:
+            components = item.components
+            value = 1 * item.subtype._unit * other
+            item.subtype._unit = value.unit
+            np.multiply(components, value.value, out=components)
         return self
 
     def __truediv__(self, other):
         """Divide the components of the CSDM object by a scalar."""
         other = check_scalar_object(other, "/")
 
-        obj = self.copy()
-        for item in obj.dependent_variables:
-            if not isinstance(other, Quantity):
-                item.components = item.components / other
-            else:
-                value = (1 * item.subtype._unit) / other
-                item.subtype._unit = value.unit
-                item.components = item.components * value.value
+        obj = self._copy_for_arithmetic()
+        if not isinstance(other, Quantity):
+            for item in obj._dependent_variables:
+                _apply_to_components(np.divide, item, other)
+            return obj
+
+        for item in obj._dependent_variables:
+            value = (1 * item.subtype._unit) / other
+            item.subtype._unit = value.unit
+            _apply_to_components(np.multiply, item, value.value)
         return obj
 
     def __rtruediv__(self, other):
         """Right divide the components of the CSDM object by a scalar."""
-        return np.reciprocal(self) * other
+        other = check_scalar_object(other, "*")
+        return np.reciprocal(self)._multiply_components(other)
 
     def __itruediv__(self, other):
         """In place division of the components of the CSDM object by a scalar."""
         other = check_scalar_object(other, "/")
 
-        for item in self.dependent_variables:
-            if not isinstance(other, Quantity):
-                item.components *= 1 / other
-            else:
-                value = (1 * item.subtype._unit) / other
-                item.subtype._unit = value.unit
-                item.components *= value.value
+        if not isinstance(other, Quantity):
+            for item in self._dependent_variables:
+                components = item.components
+                np.divide(components, other, out=components)
+            return self
+
+        for item in self._dependent_variables:
+            components = item.components
+            value = (1 * item.subtype._unit) / other
+            item.subtype._unit = value.unit
+            np.multiply(components, value.value, out=components)
         return self
 
     def __pow__(self, other):
@@ -411,7 +481,7 @@ class CSDM:
     def __ipow__(self, other):
         """Raise the components of the CSDM object to a scalar value."""
         other = check_scalar_object(other, "**")
-        for item in self.dependent_variables:
+        for item in self._dependent_variables:
             item.components.__ipow__(other)
             item.subtype._unit = item.subtype._unit**other
         return self
@@ -451,17 +521,13 @@ class CSDM:
             dim_.copy_metadata(dim)
             new_dim = dim_[indices[i]]
             if new_dim.size > 1:
-                csdm._dimensions += [new_dim]
+                csdm._dimensions._append_unchecked(new_dim)
 
         for variable in self.dependent_variables:
             section = (slice(0, len(variable.components), 1),) + indices[::-1]
             components = variable.components[section]
-            dv_obj = empty_dependent_variable(
-                variable.numeric_type, variable.quantity_type
-            )
-            dv_obj.subtype._components = components
-            dv_obj.copy_metadata(variable)
-            csdm._dependent_variables += [dv_obj]
+            dv_obj = DependentVariable._from_existing(variable, components)
+            csdm._dependent_variables._append_unchecked(dv_obj)
 
         csdm.copy_metadata(self)
         if len(csdm.dimensions) == 0 and len(csdm.dependent_variables) == 1:
@@ -642,8 +708,7 @@ class CSDM:
             AttributeError: When modified.
         """
         dictionary = self._dict(filename=self.filename, for_display=True)
-
-        return json.dumps(dictionary, ensure_ascii=False, sort_keys=False, indent=2)
+        return _json_dumps(dictionary)
 
     @property
     def filename(self):
@@ -671,11 +736,12 @@ class CSDM:
         new.copy_metadata(self)
         new._dimensions += self._dimensions[::-1]
 
+        # keep the component axis first and reverse the dimension axes.
         for item in self.dependent_variables:
-            dv_obj = empty_dependent_variable(item.numeric_type, item.quantity_type)
-            dv_obj.copy_metadata(item)
-            dv_obj.subtype._components = np.moveaxis(item.subtype._components.T, -1, 0)
-            new._dependent_variables += [dv_obj]
+            components = item.subtype._components
+            axes = (0,) + tuple(range(components.ndim - 1, 0, -1))
+            dv_obj = DependentVariable._from_existing(item, components.transpose(axes))
+            new._dependent_variables._append_unchecked(dv_obj)
 
         return new
 
@@ -700,7 +766,8 @@ class CSDM:
         Args:
             shape: A list of dimension objects or integers.
         """
-        size = self.y[0].components[0].size
+        components = self.y[0].components
+        size = components.size // components.shape[0]
 
         shape_int = [item if isinstance(item, int) else item.size for item in shape]
         new_dim = []
@@ -713,12 +780,15 @@ class CSDM:
             )
             new_dim.append(dim)
 
+        new_csdm = CSDM(dimensions=new_dim)
         for d_v in self.y:
-            new_shape = (d_v.components.shape[0],) + tuple(shape_int[::-1])
-            new_dv = as_dependent_variable(array=d_v.components.reshape(new_shape))
-            new_dv.copy_metadata(d_v)
+            components = d_v.components
+            new_shape = (components.shape[0],) + tuple(shape_int[::-1])
+            new_dv = DependentVariable._from_existing(
+                d_v, np.ascontiguousarray(components.reshape(new_shape))
+            )
+            new_csdm._dependent_variables._append_unchecked(new_dv)
 
-        new_csdm = CSDM(dimensions=new_dim, dependent_variables=[new_dv])
         new_csdm.copy_metadata(self)
         return new_csdm
 
@@ -789,10 +859,10 @@ class CSDM:
             DeprecationWarning,
         )
         if args != () and isinstance(args[0], __dimensions_list__):
-            self._dimensions += [args[0]]
+            self._dimensions._append_unchecked(args[0])
             return
 
-        self._dimensions += [Dimension(*args, **kwargs)]
+        self._dimensions._append_unchecked(Dimension(*args, **kwargs))
 
     def add_dependent_variable(self, *args, **kwargs):
         """Add a new :ref:`dv_api` instance to the :ref:`csdm_api` instance.
@@ -864,10 +934,11 @@ class CSDM:
             d_v.encoding = "base64"
             d_v.type = "internal"
 
-        if self.shape != ():
-            d_v._reshape(self.shape[::-1])
+        shape = self.shape
+        if shape != ():
+            d_v._reshape(shape[::-1])
 
-        self._dependent_variables += [d_v]
+        self._dependent_variables._append_unchecked(d_v)
 
     def to_dict(self, update_timestamp=False, read_only=False):
         """Alias to the `dict()` method of the class."""
@@ -893,27 +964,25 @@ class CSDM:
         read_only=None,
         version=None,
         for_display=False,
+        pending_writes=None,
     ):
-        obj = {}
-        obj["version"] = self.version if version is None else version
-        obj["read_only"] = self.read_only if read_only is None else read_only
-        obj["timestamp"] = (
-            datetime.datetime.utcnow().isoformat()[:-7] + "Z"
-            if update_timestamp
-            else self.timestamp
-        )
-        obj["geographic_coordinate"] = self.geographic_coordinate
-        obj["tags"] = self.tags
-        obj["description"] = self.description.strip()
-        obj["application"] = self.application
-        obj["dimensions"] = [dim.dict() for dim in self.dimensions]
-        obj["dependent_variables"] = [
-            dv._dict(filename=filename, dataset_index=i, for_display=for_display)
-            for i, dv in enumerate(self.dependent_variables)
-        ]
+        obj = {
+            "version": self.version if version is None else version,
+            "read_only": self.read_only if read_only is None else read_only,
+            "timestamp": _utc_timestamp() if update_timestamp else self.timestamp,
+            "geographic_coordinate": self.geographic_coordinate,
+            "tags": self.tags,
+            "description": self.description.strip(),
+            "application": self.application,
+            "dimensions": [dim.dict() for dim in self.dimensions],
+            "dependent_variables": [
+                dv._dict(filename, i, for_display, pending_writes)
+                for i, dv in enumerate(self.dependent_variables)
+            ],
+        }
 
         empty_values = [[], "", {}, False, None]
-        _ = [obj.pop(_) for _ in [k for k, v in obj.items() if v in empty_values]]
+        obj = {k: v for k, v in obj.items() if v not in empty_values}
 
         return {"csdm": obj}
 
@@ -924,18 +993,30 @@ class CSDM:
             update_timestamp(bool): If True, timestamp is updated to current time.
             read_only (bool): If true, the file is serialized as read_only.
 
+        The string is serialized with orjson, when installed, unless additional
+        keyword arguments for `json.dumps` are given.
+
         Example:
-            >>> data.dumps()[:63] # first 63 characters
-            '{"csdm": {"version": "1.0", "timestamp": "1994-11-05T13:15:30Z"'
+            >>> data.dumps()[:59] # first 59 characters
+            '{"csdm":{"version":"1.0","timestamp":"1994-11-05T13:15:30Z"'
         """
         dict_ = self._dict(
             update_timestamp=update_timestamp, read_only=read_only, version=self.version
         )
+        if not kwargs:
+            return _json_dumps(dict_, indent=None, allow_nan=False)
         return json.dumps(
             dict_, ensure_ascii=False, sort_keys=False, allow_nan=False, **kwargs
         )
 
-    def save(self, filename="", read_only=False, output_device=None, indent=0):
+    def save(
+        self,
+        filename="",
+        read_only=False,
+        output_device=None,
+        indent=0,
+        binary_components=False,
+    ):
         """Serialize the :ref:`CSDM_api` instance as a JSON data-exchange file.
 
         There are two types of file serialization extensions, `.csdf` and
@@ -962,13 +1043,18 @@ class CSDM:
         The parameter `filename` is an argument of this method.
 
         .. note:: Only dependent variables with ``encoding="raw"`` will be
-            serialized to a binary file.
+            serialized to a binary file, unless `binary_components` is True.
 
         Args:
             filename (str): The filename of the serialized file.
             read_only (bool): If true, the file is serialized as read_only.
             output_device(object): Object where the data is written. If provided,
                 the argument `filename` become irrelevant.
+            indent(int): The JSON indentation. The default, 0, writes compact JSON.
+            binary_components(bool): If true, the components of every dependent
+                variable are serialized to a binary file, irrespective of the
+                encoding attribute. The encoding of the dependent variables is left
+                unchanged.
 
         Example:
             >>> data.save('my_file.csdf')
@@ -979,22 +1065,35 @@ class CSDM:
 
             os.remove("my_file.csdf")
         """
-        dictionary = self._dict(filename=filename, version=self.version)
+        # the binary files of the raw encoded dependent variables are written
+        # together once the dictionary is built.
+        pending_writes = []
+        encodings = [item.encoding for item in self.dependent_variables]
+        try:
+            if binary_components:
+                for item in self.dependent_variables:
+                    item.encoding = "raw"
+            dictionary = self._dict(
+                filename=filename, version=self.version, pending_writes=pending_writes
+            )
+        finally:
+            for item, encoding in zip(self.dependent_variables, encodings):
+                item.encoding = encoding
+        _write_binary_files(pending_writes)
 
-        timestamp = datetime.datetime.utcnow().isoformat()[:-7] + "Z"
-        dictionary["csdm"]["timestamp"] = timestamp
+        dictionary["csdm"]["timestamp"] = _utc_timestamp()
 
         if read_only:
             dictionary["csdm"]["read_only"] = read_only
 
-        kwargs = dict(
-            ensure_ascii=False, sort_keys=False, indent=indent, allow_nan=False
-        )
+        # serialize once and hand the whole document to a single write call.
+        encoded = _json_encode(dictionary, indent, allow_nan=False)
         if output_device is not None:
-            json.dump(dictionary, output_device, **kwargs)
+            output_device.write(encoded.decode("utf-8"))
+            return
 
-        with open(filename, "w", encoding="utf8") as outfile:
-            json.dump(dictionary, outfile, **kwargs)
+        with open(filename, "wb") as outfile:
+            outfile.write(encoded)
 
     def to_list(self):
         r"""Return the dimension coordinates and dependent variable components as
@@ -1025,21 +1124,50 @@ class CSDM:
         Example:
             >>> data_32 = data_64.astype('float32')  # doctest: +SKIP
         """
-        copy_ = self.copy()
-        for var in copy_.dependent_variables:
+        copy_ = self.copy(deep=False)
+        for var, item in zip(copy_.dependent_variables, self.dependent_variables):
             var.numeric_type = numeric_type
+            # the components are still shared when the numeric type is unchanged.
+            if var.components is item.components:
+                var.components = item.components.copy()
         return copy_
 
-    def copy(self):
+    def copy(self, deep=True):
         """Create a copy of the current CSDM instance.
 
+        Args:
+            deep(bool): If False, the components array of each dependent variable is
+                shared with the current instance instead of being copied.
+
         Returns:
             A CSDM instance.
 
         Example:
             >>> data2 = data.copy()
         """
-        return deepcopy(self)
+        if deep:
+            return deepcopy(self)
+        return self._copy_for_arithmetic(share_components=True)
+
+    def _copy_for_arithmetic(self, share_components=False):
+        """Return a copy of the CSDM object for the out-of-place arithmetic
+        operations. The immutable metadata is shared with this object, and the
+        dimensions and dependent variables are copied structurally. The components
+        arrays are copied unless share_components is True.
+        """
+        new = CSDM.__new__(CSDM)
+        new.copy_metadata(self)
+        new._tags = list(self._tags)
+        new._geographic_coordinate = deepcopy(self._geographic_coordinate)
+        new._application = deepcopy(self._application)
+        new._dimensions = _shallow_copy_dimensions(self)
+        new._dependent_variables = DependentVariableList(
+            [
+                item._copy(item.components if share_components else None)
+                for item in self._dependent_variables
+            ]
+        )
+        return new
 
     def split(self):
         """View of the dependent-variables as individual csdm objects.
@@ -1191,13 +1319,12 @@ class CSDM:
                 "the clip method. Used `.split()` method to split the dependent "
                 "variables into individual csdm objects and try again."
             )
-        a_max = max
-        if max is None:
-            a_max = self.dependent_variables[0].components.max()
+        # numpy accepts one open bound, so the components are only scanned for a
+        # bound when neither is given.
         a_min = min
-        if min is None:
+        if min is None and max is None:
             a_min = self.dependent_variables[0].components.min()
-        return np.clip(self, a_min, a_max)
+        return np.clip(self, a_min, max)
 
     def conj(self):
         """Return a complex conjugate of the csdm object."""
@@ -1353,12 +1480,12 @@ class CSDM:
             return get_new_csdm_object_after_applying_ufunc(
                 csdm, function, None, None, *args_, **args_kw
             )
-        if function in [np.pad]:
+        if function is np.pad:
             return apply_np_padding(function, *args, **kwargs)
 
         if function in __shape_manipulation_functions__:
             dim_len = len(args[0][0].dimensions)
-            if "axes" in args[1].keys():
+            if "axes" in args[1]:
                 axes = (0,) + tuple(-np.asarray(args[1]["axes"]) - 1)
                 axes_dim = args[1]["axes"]
                 args[1]["axes"] = axes
@@ -1378,9 +1505,9 @@ class CSDM:
                 function, *args[0], **args[1], **kwargs
             )
 
-            csdm._dimensions = tuple(
-                csdm.dimensions[axes_dim[i]] for i in range(len(csdm.dimensions))
-            )
+            # permute the dimension references, the objects are not copied again.
+            dims = csdm._dimensions
+            csdm._dimensions = DimensionList([dims[i] for i in axes_dim])
             return csdm
 
         # if function in __return_np__:
@@ -1427,6 +1554,9 @@ class CSDM:
                 - The 2D{3} pixel dataset use the plt.imshow(), assuming the pixel
                   dataset as an RGB image.
 
+                The keyword `disp_skip=n` draws the figure only on every n-th call for
+                the same figure, which is useful for updating a preview within a loop.
+
         Returns:
             A matplotlib figure instance.
 
@@ -1483,11 +1613,12 @@ def get_new_csdm_object_after_applying_ufunc(
     """Perform the operation, func, on the components of the dependent variables, and
     return the corresponding CSDM object.
     """
+    variables = csdm._dependent_variables
     if factor is None:
-        factor = np.ones(len(csdm.dependent_variables))
+        factor = np.ones(len(variables))
     axis = kwargs.get("axis", None)
     if axis is not None:
-        kwargs["axis"] = _check_dimension_indices(len(csdm.dimensions), axis)
+        kwargs["axis"] = _check_dimension_indices(len(csdm._dimensions), axis)
 
     np_check_for_out(csdm, **kwargs)
 
@@ -1495,17 +1626,19 @@ def get_new_csdm_object_after_applying_ufunc(
 
     # dimension should be added first so that the dependent variables can be
     # shaped appropriately.
-    new._dimensions = deepcopy(csdm.dimensions)
-
-    for i, variable in enumerate(csdm.dependent_variables):
-        res = func(variable.components * factor[i], *inputs, **kwargs)
-
-        obj = empty_dependent_variable(
-            numeric_type=res.dtype, quantity_type=variable.quantity_type
-        )
-        obj.copy_metadata(variable)
-        obj.subtype._components = res
-        new._dependent_variables += [obj]
+    new._dimensions = _shallow_copy_dimensions(csdm)
+
+    # a ufunc always allocates its output, so the unit scaling is skipped when it
+    # neither scales the values nor up-casts the integer components.
+    is_ufunc = isinstance(func, np.ufunc)
+    for i, variable in enumerate(variables):
+        components = variable.components
+        if not (is_ufunc and factor[i] == 1 and components.dtype.kind in "fc"):
+            components = components * factor[i]
+        res = func(components, *inputs, **kwargs)
+
+        obj = DependentVariable._from_existing(variable, res)
+        new._dependent_variables._append_unchecked(obj)
         # obj = as_dependent_variable(y, quantity_type=variable.quantity_type)
         # obj.copy_metadata(variable)
         # new.add_dependent_variable(obj)
@@ -1529,16 +1662,12 @@ def get_new_csdm_object_after_applying_function(func, *args, **kwargs):
 
     # dimension should be added first so that the dependent variables can be
     # shaped appropriately.
-    new._dimensions = deepcopy(csdm.dimensions)
+    new._dimensions = _shallow_copy_dimensions(csdm)
 
     for variable in csdm.dependent_variables:
         components = func(variable.components, *args_, **kwargs)
-        obj = empty_dependent_variable(
-            numeric_type=components.dtype, quantity_type=variable.quantity_type
-        )
-        obj.copy_metadata(variable)
-        obj.subtype._components = components
-        new._dependent_variables += [obj]
+        obj = DependentVariable._from_existing(variable, components)
+        new._dependent_variables._append_unchecked(obj)
 
     new.copy_metadata(csdm)
     return new
@@ -1548,14 +1677,16 @@ def get_new_csdm_object_after_apodization(csdm, func, arg, index=-1):
     """Perform the operation, func, on the components of the dependent variables, and
     return the corresponding CSDM object.
     """
-    index = _check_dimension_indices(len(csdm.dimensions), index)
+    dimensions = csdm._dimensions
+    ndim = len(dimensions)
+    index = _check_dimension_indices(ndim, index)
     index = [index] if isinstance(index, int) else index
 
     quantity = string_to_quantity(arg)
 
-    apodization_vector_nd = 1
+    apodization_vectors = []
     for i in index:
-        dimension_coordinates = csdm.dimensions[-i - 1].coordinates
+        dimension_coordinates = dimensions[-i - 1].coordinates
         function_arguments = quantity * dimension_coordinates
 
         if function_arguments.unit.physical_type != "dimensionless":
@@ -1566,30 +1697,21 @@ def get_new_csdm_object_after_apodization(csdm, func, arg, index=-1):
             )
         apodization_vector = func(function_arguments.to("").value)
 
-        apodization_vector_1d = _get_broadcast_shape(
-            apodization_vector, len(csdm.dimensions), i
-        )
-        apodization_vector_nd = apodization_vector_nd * apodization_vector_1d
+        apodization_vectors.append(_get_broadcast_shape(apodization_vector, ndim, i))
 
     new = CSDM()
 
     # dimension should be added first so that the dependent variables can be
     # shaped appropriately.
-    new._dimensions = deepcopy(csdm.dimensions)
-
-    for variable in csdm.dependent_variables:
-        components = variable.components * apodization_vector_nd
+    new._dimensions = _shallow_copy_dimensions(csdm)
 
-        obj = empty_dependent_variable(
-            numeric_type=components.dtype, quantity_type=variable.quantity_type
-        )
-        obj.copy_metadata(variable)
-        obj.subtype._components = components
-        new._dependent_variables += [obj]
-
-        # obj = as_dependent_variable(y, quantity_type=variable.quantity_type)
-        # obj.copy_metadata(variable)
-        # new.add_dependent_variable(obj)
+    variables = csdm._dependent_variables
+    results = _multiply_components_by_vectors(
+        [variable.components for variable in variables], apodization_vectors
+    )
+    for variable, components in zip(variables, results):
+        obj = DependentVariable._from_existing(variable, components)
+        new._dependent_variables._append_unchecked(obj)
 
     new.copy_metadata(csdm)
     return new
@@ -1608,20 +1730,16 @@ def get_new_csdm_object_after_dimension_reduction_func(func, *args, **kwargs):
     # dimension should be added first so that the dependent variables can be
     # shaped appropriately.
     if axis is not None:
-        for i, variable in enumerate(csdm.dimensions):
+        for i, variable in enumerate(csdm._dimensions):
             if -1 - i not in axis:
-                new.dimensions.append(variable.copy())
+                new._dimensions._append_unchecked(variable.copy())
 
-    for variable in csdm.dependent_variables:
+    for variable in csdm._dependent_variables:
         components = func(variable.components, *args_, **kwargs)
 
         if axis is not None:
-            obj = empty_dependent_variable(
-                numeric_type=components.dtype, quantity_type=variable.quantity_type
-            )
-            obj.copy_metadata(variable)
-            obj.subtype._components = components
-            new._dependent_variables += [obj]
+            obj = DependentVariable._from_existing(variable, components)
+            new._dependent_variables._append_unchecked(obj)
 
             # obj = as_dependent_variable(y, quantity_type=variable.quantity_type)
             # obj.copy_metadata(variable)
@@ -1637,6 +1755,181 @@ def get_new_csdm_object_after_dimension_reduction_func(func, *args, **kwargs):
     return new
 
 
+def _multiply_components_by_vectors(arrays, vectors):
+    """Return the products of the arrays with the broadcast vectors. The vectors are
+    applied in turn, in-place on each output, so that their outer product is never
+    materialized. When the arrays share a shape and dtype, the products are written
+    into a single stacked block, and the returned arrays are views of the block.
+    """
+    shapes = [item.shape for item in vectors]
+    first = arrays[0] if arrays else None
+    if len(arrays) > 1 and all(
+        item.shape == first.shape and item.dtype == first.dtype for item in arrays
+    ):
+        shape = (len(arrays),) + np.broadcast_shapes(first.shape, *shapes)
+        outputs = np.empty(shape, dtype=np.result_type(first, *vectors))
+    else:
+        outputs = [
+            np.empty(
+                np.broadcast_shapes(item.shape, *shapes),
+                dtype=np.result_type(item, *vectors),
+            )
+            for item in arrays
+        ]
+
+    for array, out in zip(arrays, outputs):
+        np.multiply(array, vectors[0], out=out)
+        for vector in vectors[1:]:
+            np.multiply(out, vector, out=out)
+    return list(outputs)
+
+
+def _shallow_copy_dimensions(csdm):
+    """Return a DimensionList of shallow copies of the csdm object dimensions."""
+    return DimensionList([item._shallow_copy() for item in csdm._dimensions])
+
+
+def _get_buffer(buffer, shape, dtype):
+    """Return the buffer if it has the given shape and dtype, else a new empty array."""
+    if buffer is not None and buffer.shape == shape and buffer.dtype == dtype:
+        return buffer
+    return np.empty(shape, dtype=dtype)
+
+
+def _numexpr_scaled_update(out, other, factor, symbol):
+    """Evaluate `out = out +/- factor * other` in-place with numexpr. Return False,
+    without evaluating, when the arrays are not suited for the numexpr path.
+    """
+    if ne.nthreads < 2 or out.size < _NUMEXPR_MIN_SIZE:
+        return False
+    if out.shape != other.shape or out.dtype != other.dtype:
+        return False
+    if out.dtype not in _NUMEXPR_DTYPES:
+        return False
+    local_dict = {"a": out, "b": other, "f": np.asarray(factor, dtype=out.dtype)}
+    ne.evaluate(f"a {symbol} f * b", local_dict=local_dict, out=out)
+    return True
+
+
+def _utc_timestamp():
+    """Return the current UTC time as an ISO 8601 string, YYYY-MM-DDTHH:MM:SSZ."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _write_binary_files(pending_writes):
+    """Write the (data, path) pairs to binary files. Multiple files are written
+    concurrently, as numpy releases the GIL while writing.
+    """
+    if len(pending_writes) < 2:
+        for data, path in pending_writes:
+            data.tofile(path)
+        return
+
+    workers = min(8, len(pending_writes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # consume the results to re-raise any write error.
+        _ = list(executor.map(np.ndarray.tofile, *zip(*pending_writes)))
+
+
+def _has_non_finite(obj):
+    """Return True if the JSON-serializable object holds a NaN or infinite number.
+    Lists of numbers, such as components with the none encoding, are checked as one
+    numpy array.
+    """
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        array = None
+        if obj and isinstance(obj[0], (int, float, complex)):
+            try:
+                array = np.asarray(obj)
+            except (ValueError, OverflowError):
+                pass
+        if array is None or array.dtype.kind not in "biufc":
+            return any(_has_non_finite(item) for item in obj)
+        obj = array
+    if isinstance(obj, (float, complex, np.ndarray, np.generic)):
+        obj = np.asarray(obj)
+        return obj.dtype.kind in "fc" and not np.isfinite(obj).all()
+    return False
+
+
+def _json_encode(dictionary, indent=2, allow_nan=True):
+    """Serialize the dictionary to UTF-8 encoded JSON. Uses orjson, when installed,
+    and falls back to the json module for objects orjson rejects.
+
+    An indent of None or 0 writes compact JSON. orjson only indents by two spaces,
+    so other indents are always written with the json module. orjson writes NaN and
+    infinity as null, so with allow_nan=False a dictionary holding a non-finite
+    number is serialized with the json module, which raises.
+    """
+    use_orjson = orjson is not None and indent in (None, 0, 2)
+    if use_orjson and (allow_nan or not _has_non_finite(dictionary)):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(dictionary, option=option)
+        except TypeError:
+            pass
+    # match the compact orjson separators when not indenting.
+    separators = None
+    if not indent:
+        indent, separators = None, (",", ":")
+    kwargs = dict(ensure_ascii=False, sort_keys=False, allow_nan=allow_nan)
+    encoded = json.dumps(dictionary, indent=indent, separators=separators, **kwargs)
+    return encoded.encode("utf-8")
+
+
+def _json_dumps(dictionary, indent=2, allow_nan=True):
+    """Serialize the dictionary to a JSON string. See _json_encode for details."""
+    return _json_encode(dictionary, indent, allow_nan).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _unit_to_factor(src_unit, dst_unit):
+    """Return the factor converting src_unit to dst_unit. Cached, since repeated
+    operations between the same objects request the same conversions.
+    """
+    return src_unit.to(dst_unit)
+
+
+@functools.lru_cache(maxsize=256)
+def _physical_type(unit):
+    """Return the physical type of the unit. Cached, since the lookup is costly."""
+    return unit.physical_type
+
+
+def _quantity_value_in_unit(quantity, unit):
+    """Return the value of the quantity in the given unit. The value is scaled only
+    when the conversion factor is not one.
+    """
+    if quantity.unit is unit:
+        return quantity.value
+    factor = _unit_to_factor(quantity.unit, unit)
+    return quantity.value if factor == 1.0 else factor * quantity.value
+
+
+def _apply_to_components(func, variable, value):
+    """Apply the binary ufunc, func, to the components of the dependent variable and
+    value. The result is written in-place when its dtype matches the dtype of the
+    components, otherwise a new components array is assigned.
+    """
+    components = variable.components
+    # resolve the output dtype from zero-length slices of the components, and of
+    # the value when it is an array of the same shape, e.g. the components of a
+    # second csdm object.
+    if isinstance(value, np.ndarray) and value.ndim == components.ndim:
+        dtype = func(components[:0], value[:0]).dtype
+    else:
+        dtype = func(components[:0], value).dtype
+    if dtype == components.dtype:
+        func(components, value, out=components)
+    else:
+        variable.components = func(components, value)
+
+
 def empty_dependent_variable(numeric_type, quantity_type="scalar"):
     """Create an empty dependent variable object"""
     return DependentVariable(
@@ -1651,7 +1944,7 @@ def apply_np_padding(function, *args, **kwargs):
     """Apply numpy padding"""
     args0 = list(args[0])
     n_dims = len(args0[0].x)
-    if "pad_width" in args[1].keys():
+    if "pad_width" in args[1]:
         pads = np_check_pads(args[1]["pad_width"], n_dims)
         pads = ((0, 0),) + tuple(pads)[::-1]
         args[1]["pad_width"] = pads
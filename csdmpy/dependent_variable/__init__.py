@@ -1,6 +1,7 @@
 """Dependent variable object: attributes and methods."""
 import json
 import warnings
+from copy import copy
 from copy import deepcopy
 
 import numpy as np
@@ -668,14 +669,47 @@ class DependentVariable:
         """
         return self.subtype.dict()
 
-    def _dict(self, filename=None, dataset_index=None, for_display=False):
+    def _dict(
+        self, filename=None, dataset_index=None, for_display=False, pending_writes=None
+    ):
         """Return DependentVariable object as a python dictionary."""
-        return self.subtype.dict(filename, dataset_index, for_display)
+        return self.subtype.dict(filename, dataset_index, for_display, pending_writes)
 
     def copy(self):
         """Return a copy of the DependentVariable object."""
         return deepcopy(self)
 
+    def _copy(self, components=None):
+        """Return a structural copy of the DependentVariable object. The immutable
+        attributes are shared, the mutable attributes are copied, and the components
+        array is copied unless a replacement array is given.
+        """
+        subtype = copy(self.subtype)
+        subtype._numeric_type = copy(subtype._numeric_type)
+        subtype._quantity_type = copy(subtype._quantity_type)
+        subtype._component_labels = list(subtype._component_labels)
+        subtype._application = deepcopy(subtype._application)
+        subtype._sparse_sampling = deepcopy(subtype._sparse_sampling)
+        subtype._components = (
+            subtype._components.copy() if components is None else components
+        )
+        new = object.__new__(DependentVariable)
+        new.subtype = subtype
+        new._type = self._type
+        return new
+
+    @classmethod
+    def _from_existing(cls, template, components):
+        """Return a new dense DependentVariable object with the metadata of the
+        template and the given components array. The numeric type follows the dtype
+        of the components. Used to wrap the results of numpy operations without
+        re-validating the metadata.
+        """
+        new = template._copy(components)
+        new.subtype._numeric_type.update(components.dtype)
+        new.subtype._sparse_sampling = {}
+        return new
+
     def _reshape(self, shape):
         r"""Reshapes the components array.
 
@@ -701,7 +735,9 @@ class DependentVariable:
                 f"number of grid points, {grid_points}."
             )
         if item._sparse_sampling == {}:
-            item._components = np.asarray(
+            # store a C-contiguous buffer so that the ufuncs in the arithmetic
+            # operations take the contiguous inner loops.
+            item._components = np.ascontiguousarray(
                 item._components[:, :grid_points].reshape(sub_shape), dtype=dtype
             )
         else:
@@ -768,7 +804,7 @@ def as_dependent_variable(array, **kwargs):
             f"Cannot convert a {array.ndim} dimensional array to a DependentVariable "
             "object."
         )
-    if "quantity_type" not in kwargs.keys():
+    if "quantity_type" not in kwargs:
         kwargs["quantity_type"] = "scalar"
 
     return DependentVariable(type="internal", components=array, **kwargs)
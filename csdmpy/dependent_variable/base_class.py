@@ -1,5 +1,6 @@
 """The Base DependentVariable class."""
 import base64
+import functools
 import warnings
 from copy import deepcopy
 
@@ -68,11 +69,11 @@ class BaseDependentVariable:
         )
 
     def __eq__(self, other):
-        check = [
+        if not all(
             getattr(self, _) == getattr(other, _) for _ in __class__.__slots__[:-1]
-        ]
-        check += [np.allclose(self._components, other._components)]
-        return False if False in check else True
+        ):
+            return False
+        return bool(np.allclose(self._components, other._components))
 
     def set_component_labels(self, component_labels):
         """Assign an array of strings, based on the number of components.
@@ -118,7 +119,7 @@ class BaseDependentVariable:
     @property
     def name(self):
         """Return name associated with the dependent variable."""
-        return deepcopy(self._name)
+        return self._name
 
     @name.setter
     def name(self, value):
@@ -127,12 +128,12 @@ class BaseDependentVariable:
     @property
     def unit(self):
         """Return uint associated with the dependent variable."""
-        return deepcopy(self._unit)
+        return self._unit
 
     @property
     def quantity_name(self):
         """Return quantity name associated with the physical quantity."""
-        return deepcopy(str(self._quantity_name))
+        return str(self._quantity_name)
 
     @quantity_name.setter
     def quantity_name(self, value=""):
@@ -141,7 +142,7 @@ class BaseDependentVariable:
     @property
     def encoding(self):
         """Return encoding method used in storing dependent variable."""
-        return deepcopy(self._encoding)
+        return self._encoding
 
     @encoding.setter
     def encoding(self, value):
@@ -188,7 +189,7 @@ class BaseDependentVariable:
     @property
     def description(self):
         """Return a description of the dependent variable."""
-        return deepcopy(self._description)
+        return self._description
 
     @description.setter
     def description(self, value):
@@ -223,55 +224,60 @@ class BaseDependentVariable:
         """Alias to the `dict()` method of the class."""
         return self.dict(filename, dataset_index, for_display)
 
-    def dict(self, filename=None, dataset_index=None, for_display=False):
+    def dict(
+        self, filename=None, dataset_index=None, for_display=False, pending_writes=None
+    ):
         """Return a dictionary object of the base class."""
-        obj = {}
-        obj["description"] = self._description.strip()
-        obj["name"] = self._name.strip()
-        obj["unit"] = (
-            ScalarQuantity(1.0 * self._unit).__format__("unit")
-            if str(self._unit) != ""
-            else ""
-        )
-        obj["quantity_name"] = self.quantity_name
-        obj["encoding"] = str(self._encoding)
-        obj["numeric_type"] = str(self._numeric_type)
-        obj["quantity_type"] = str(self._quantity_type)
-
-        for label in self._component_labels:
-            if label.strip() != "":
-                obj["component_labels"] = self._component_labels
-                break
-
-        obj["application"] = self._application
+        labels = self._component_labels
+        obj = {
+            "description": self._description.strip(),
+            "name": self._name.strip(),
+            "unit": _format_unit(self._unit),
+            "quantity_name": self.quantity_name,
+            "encoding": str(self._encoding),
+            "numeric_type": str(self._numeric_type),
+            "quantity_type": str(self._quantity_type),
+            "component_labels": labels
+            if any(label.strip() != "" for label in labels)
+            else None,
+            "application": self._application,
+        }
 
         empty_values = [[], "", {}, "dimensionless", "unknown", None]
-        _ = [obj.pop(_) for _ in [k for k, v in obj.items() if v in empty_values]]
+        obj = {k: v for k, v in obj.items() if v not in empty_values}
 
         if for_display:
             obj["components"] = reduced_display(self._components)
             del obj["encoding"]
             return obj
 
-        self.get_proper_encoded_data(obj, filename, dataset_index)
+        self.get_proper_encoded_data(obj, filename, dataset_index, pending_writes)
         return obj
 
-    def get_proper_encoded_data(self, obj, filename=None, dataset_index=None):
-        """Encode dependent variables to encoding type."""
+    def get_proper_encoded_data(
+        self, obj, filename=None, dataset_index=None, pending_writes=None
+    ):
+        """Encode dependent variables to encoding type. For the raw encoding, the
+        (data, path) pair is appended to the pending_writes list, when given, instead
+        of writing the binary file."""
         data = self.ravel_data()
 
-        if self.encoding == "none":
+        encoding = self._encoding
+        if encoding == "none":
             obj["components"] = data.tolist()
 
-        if self.encoding == "base64":
+        elif encoding == "base64":
             obj["components"] = [base64.b64encode(_).decode("utf-8") for _ in data]
 
-        if self.encoding == "raw":
+        elif encoding == "raw":
             url_relative_path, absolute_path = get_relative_url_path(
                 dataset_index, filename
             )
 
-            data.ravel().tofile(absolute_path)
+            if pending_writes is None:
+                data.ravel().tofile(absolute_path)
+            else:
+                pending_writes.append((data.ravel(), absolute_path))
 
             obj["type"] = "external"
             obj["components_url"] = url_relative_path
@@ -312,9 +318,14 @@ def reduced_display(_components):
     """Reduced display for quick view of the data structure. The method shows the
     first and the last two data values.
     """
-    _string = []
-    for _, item in enumerate(_components):
-        temp = item.ravel()
-        lst = [str(temp[0]), str(temp[1]), str(temp[-2]), str(temp[-1])]
-        _string.append([("{}, {}, ..., {}, {}").format(*lst)])
-    return _string
+    # index the four values through flat so non-contiguous views are not copied.
+    return [
+        ["{}, {}, ..., {}, {}".format(*item.flat[[0, 1, -2, -1]])]
+        for item in _components
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_unit(unit):
+    """Return the serialized string of a unit, or an empty string if dimensionless."""
+    return ScalarQuantity(1.0 * unit).__format__("unit") if str(unit) != "" else ""
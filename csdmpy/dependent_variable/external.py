@@ -46,9 +46,13 @@ class ExternalDataset(BaseDependentVariable):
         """Return the components_url of the CSDM serialized file."""
         return self._components_url
 
-    def dict(self, filename=None, dataset_index=None, for_display=False):
+    def dict(
+        self, filename=None, dataset_index=None, for_display=False, pending_writes=None
+    ):
         """Return ExternalDataset object as a python dictionary."""
         dictionary = {}
         dictionary["type"] = "internal"
-        dictionary.update(super().dict(filename, dataset_index, for_display))
+        dictionary.update(
+            super().dict(filename, dataset_index, for_display, pending_writes)
+        )
         return dictionary
@@ -52,9 +52,13 @@ class InternalDataset(BaseDependentVariable):
         p_1 = self.quantity_type.p
         self._components = self._components.reshape(p_1, int(size / p_1))
 
-    def dict(self, filename=None, dataset_index=None, for_display=False):
+    def dict(
+        self, filename=None, dataset_index=None, for_display=False, pending_writes=None
+    ):
         """Return InternalDataset object as a python dictionary."""
         dictionary = {}
         dictionary["type"] = "internal"
-        dictionary.update(super().dict(filename, dataset_index, for_display))
+        dictionary.update(
+            super().dict(filename, dataset_index, for_display, pending_writes)
+        )
         return dictionary
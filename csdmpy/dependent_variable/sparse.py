@@ -60,7 +60,7 @@ class SparseSampling:
             np.all(self._sparse_grid_vertexes == other._sparse_grid_vertexes),
             *[getattr(self, _) == getattr(other, _) for _ in __class__.__slots__[2:]],
         ]
-        return np.all(check)
+        return all(check)
 
     # ----------------------------------------------------------------------- #
     #                                 Attributes                              #
@@ -69,7 +69,7 @@ class SparseSampling:
     @property
     def encoding(self):
         """Return the data encoding method."""
-        return deepcopy(self._encoding)
+        return self._encoding
 
     @encoding.setter
     def encoding(self, value):
@@ -96,7 +96,7 @@ class SparseSampling:
     @property
     def description(self):
         """Return the description of the object."""
-        return deepcopy(self._description)
+        return self._description
 
     @description.setter
     def description(self, value):
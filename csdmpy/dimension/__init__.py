@@ -817,6 +817,12 @@ class Dimension:
         """Return a copy of the Dimension object."""
         return deepcopy(self)
 
+    def _shallow_copy(self):
+        """Return a copy of the Dimension object that shares the attribute values."""
+        new = object.__new__(Dimension)
+        new.subtype = self.subtype._shallow_copy()
+        return new
+
     def reciprocal_coordinates(self):
         """Return reciprocal coordinates assuming Nyquist-Shannon theorem."""
         return self.subtype.reciprocal_coordinates()
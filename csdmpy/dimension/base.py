@@ -1,6 +1,7 @@
 """Base Dimension class"""
 import json
 import warnings
+from copy import copy
 from copy import deepcopy
 
 from csdmpy.utils import validate
@@ -22,13 +23,12 @@ class BaseDimension:
 
     def __eq__(self, other):
         """Check if two objects are equal"""
-        check = [getattr(self, _) == getattr(other, _) for _ in __class__.__slots__]
-        return False if False in check else True
+        return all(getattr(self, _) == getattr(other, _) for _ in __class__.__slots__)
 
     @property
     def label(self):
         """Label associated with the dimension."""
-        return deepcopy(self._label)
+        return self._label
 
     @label.setter
     def label(self, label=""):
@@ -46,7 +46,7 @@ class BaseDimension:
     @property
     def description(self):
         """Return a description of the dimension."""
-        return deepcopy(self._description)
+        return self._description
 
     @description.setter
     def description(self, value):
@@ -98,6 +98,18 @@ class BaseDimension:
         """Return a copy of the object."""
         return deepcopy(self)
 
+    def _shallow_copy(self):
+        """Return a copy of the object that shares the attribute values with this
+        object. The application metadata and the reciprocal dimension are copied, as
+        they may be modified in-place.
+        """
+        new = copy(self)
+        new._application = deepcopy(self._application)
+        reciprocal = getattr(self, "reciprocal", None)
+        if reciprocal is not None:
+            new.reciprocal = reciprocal._shallow_copy()
+        return new
+
     @property
     def data_structure(self):
         """Json serialized string describing the Dimension object class instance."""
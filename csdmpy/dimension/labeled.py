@@ -44,7 +44,7 @@ class LabeledDimension(BaseDimension):
             np.all(self._labels == other._labels),
             super().__eq__(other),
         ]
-        return np.all(check)
+        return all(check)
 
     def is_quantitative(self):
         """Return `True`, if the dimension is quantitative, otherwise `False`.
@@ -111,6 +111,14 @@ class LabeledDimension(BaseDimension):
         if isinstance(obj, LabeledDimension):
             _copy_core_metadata(self, obj, "labeled")
 
+    def _shallow_copy(self):
+        """Return a shallow copy of the object with a copy of the labels array, as the
+        labels may be modified in-place.
+        """
+        new = super()._shallow_copy()
+        new._labels = self._labels.copy()
+        return new
+
     def dict(self):
         """Return the LabeledDimension as a python dictionary."""
         dictionary = {}
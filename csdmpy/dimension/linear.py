@@ -38,7 +38,7 @@ class LinearDimension(BaseQuantitativeDimension):
         self._increment = ScalarQuantity(increment).quantity
         self._complex_fft = check_and_assign_bool(complex_fft)
         _unit = self._increment.unit
-        if "reciprocal" not in kwargs.keys():
+        if "reciprocal" not in kwargs:
             kwargs["reciprocal"] = {
                 "increment": None,
                 "coordinates_offset": None,
@@ -70,9 +70,8 @@ class LinearDimension(BaseQuantitativeDimension):
         other = other.subtype if hasattr(other, "subtype") else other
         if not isinstance(other, LinearDimension):
             return False
-        check = [getattr(self, _) == getattr(other, _) for _ in __class__.__slots__[:4]]
-        check += [super().__eq__(other)]
-        return np.all(check)
+        check = (getattr(self, _) == getattr(other, _) for _ in __class__.__slots__[:4])
+        return all(check) and super().__eq__(other)
 
     def __mul__(self, other):
         """Multiply the LinearDimension object by a right scalar."""
@@ -255,19 +254,21 @@ def _update_linear_dimension_object_by_scalar(object_, other, type_="mul"):
     """Update object by multiplying by a scalar."""
     other = check_scalar_object(other)
 
+    # the attributes are rebound, not updated in-place, since they may be shared
+    # with shallow copies of the object.
     if type_ == "mul":
-        object_._increment *= other
-        object_._coordinates *= other
-        object_._coordinates_offset *= other
-        object_._origin_offset *= other
-        object_._period *= other
+        object_._increment = object_._increment * other
+        object_._coordinates = object_._coordinates * other
+        object_._coordinates_offset = object_._coordinates_offset * other
+        object_._origin_offset = object_._origin_offset * other
+        object_._period = object_._period * other
 
     if type_ == "truediv":
-        object_._increment /= other
-        object_._coordinates /= other
-        object_._coordinates_offset /= other
-        object_._origin_offset /= other
-        object_._period /= other
+        object_._increment = object_._increment / other
+        object_._coordinates = object_._coordinates / other
+        object_._coordinates_offset = object_._coordinates_offset / other
+        object_._origin_offset = object_._origin_offset / other
+        object_._period = object_._period / other
 
     object_._unit = object_._increment._unit
     object_._quantity_name = object_._unit.physical_type
@@ -41,7 +41,7 @@ class MonotonicDimension(BaseQuantitativeDimension):
             _unit = Quantity(1, "").unit
         else:
             _unit = ScalarQuantity(coordinates[0]).quantity.unit
-        if "reciprocal" not in kwargs.keys():
+        if "reciprocal" not in kwargs:
             kwargs["reciprocal"] = {
                 "increment": None,
                 "coordinates_offset": None,
@@ -69,7 +69,7 @@ class MonotonicDimension(BaseQuantitativeDimension):
             self.reciprocal == other.reciprocal,
             super().__eq__(other),
         ]
-        return np.all(check)
+        return all(check)
 
     def __repr__(self):
         meta = [
@@ -193,17 +193,19 @@ def _update_monotonic_dimension_object_by_scalar(object_, other, type_):
     """Update object by multiplying by a scalar."""
     other = check_scalar_object(other)
 
+    # the attributes are rebound, not updated in-place, since they may be shared
+    # with shallow copies of the object.
     if type_ == "mul":
-        object_._coordinates *= other
-        object_._coordinates_offset *= other
-        object_._origin_offset *= other
-        object_._period *= other
+        object_._coordinates = object_._coordinates * other
+        object_._coordinates_offset = object_._coordinates_offset * other
+        object_._origin_offset = object_._origin_offset * other
+        object_._period = object_._period * other
 
     if type_ == "truediv":
-        object_._coordinates /= other
-        object_._coordinates_offset /= other
-        object_._origin_offset /= other
-        object_._period /= other
+        object_._coordinates = object_._coordinates / other
+        object_._coordinates_offset = object_._coordinates_offset / other
+        object_._origin_offset = object_._origin_offset / other
+        object_._period = object_._period / other
 
     object_._values = [str(item) for item in object_._coordinates]
     object_._unit = object_._coordinates.unit
@@ -62,9 +62,8 @@ class BaseQuantitativeDimension(BaseDimension):
         self._equivalencies = None
 
     def __eq__(self, other):
-        check = [getattr(self, _) == getattr(other, _) for _ in __class__.__slots__]
-        check += [super().__eq__(other)]
-        return np.all(check)
+        check = (getattr(self, _) == getattr(other, _) for _ in __class__.__slots__)
+        return all(check) and super().__eq__(other)
 
     # ----------------------------------------------------------------------- #
     #                                Attributes                               #
@@ -112,7 +111,7 @@ class BaseQuantitativeDimension(BaseDimension):
     @property
     def quantity_name(self):
         """Quantity name associated with this dimension."""
-        return deepcopy(str(self._quantity_name))
+        return str(self._quantity_name)
 
     @quantity_name.setter
     def quantity_name(self, value):
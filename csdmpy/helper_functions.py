@@ -1,10 +1,10 @@
 """Helper functions."""
-from copy import deepcopy
 from warnings import warn
+from weakref import WeakKeyDictionary
 
 import matplotlib.projections as proj
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.image import NonUniformImage
 
 
@@ -12,6 +12,23 @@ __author__ = "Deepansh J. Srivastava"
 __email__ = "srivastava.89@osu.edu"
 
 scalar = ["scalar", "vector_1", "pixel_1", "matrix_1_1", "symmetric_matrix_1"]
+image_component_counts = frozenset({1, 3, 4})
+
+# the component count of each dependent variable is checked in the plot loops.
+message_1D = (
+    "The function requires a 1D dataset with single-component dependent "
+    "variables. For multiple dependent-variables, the data from all the "
+    "dependent variables are plotted on the same figure."
+)
+message_2D_image = (
+    "The function requires a 2D dataset with a single-component (scalar), "
+    "three components (pixel_3), or four components (pixel_4) dependent "
+    "variables. The pixel_3 produces an RGB image while pixel_4, a RGBA image."
+)
+message_2D_scalar = (
+    "The function requires a 2D dataset with a single-component (scalar), "
+    "dependent variables."
+)
 
 
 def _get_label_from_dv(dv, i):
@@ -27,7 +44,7 @@ def _get_label_from_dv(dv, i):
     return label
 
 
-class CSDMAxes(plt.Axes):
+class CSDMAxes(Axes):
     """A custom CSDM data plot axes."""
 
     name = "csdm"
@@ -89,7 +106,8 @@ class CSDMAxes(plt.Axes):
         For four-components (pixel_4) dependent-variable, an RGBA image is produced.
 
         For multiple dependent variables, the data from individual dependent-variables
-        is plotted on the same figure.
+        is plotted on the same figure. When either dimension is not `linear`, the image
+        is drawn with the matplotlib NonUniformImage class.
 
         Args:
             csdm: A CSDM object of a two-dimensional dataset with scalar, pixel_3, or
@@ -113,6 +131,7 @@ class CSDMAxes(plt.Axes):
 
         if x[0].type == "linear" and x[1].type == "linear":
             return self._call_uniform_2D_image(csdm, origin=origin, *args, **kwargs)
+        return self._call_nonuniform_2D_image(csdm, **kwargs)
 
     def contour(self, csdm, *args, **kwargs):
         """Generate a figure axes using the `contour` method from the matplotlib
@@ -174,19 +193,25 @@ class CSDMAxes(plt.Axes):
     def _call_1D(self, csdm, fn, *args, **kwargs):
         _check_1D_dataset(csdm)
         x = csdm.dimensions
-        z = csdm.split()
-        one = True if len(z) == 1 else False
+        variables = csdm.dependent_variables
+        one = True if len(variables) == 1 else False
         legend = False
 
+        # the dependent variables are plotted directly, without splitting the csdm
+        # object, against coordinates that are evaluated once. Plain arrays are passed
+        # to matplotlib, the unit is part of the axis label.
+        x_ = x[0].coordinates.value
         r_plt = None
-        for i, item in enumerate(z):
-            x_, y_ = item.to_list()
-            # dv will always be at index 0 because we called the object.split() before.
-            dv = item.dependent_variables[0]
-
-            kwargs_ = deepcopy(kwargs)
+        for i, dv in enumerate(variables):
+            y_ = dv.components
+            if len(y_) != 1:
+                raise Exception(message_1D)
+            y_ = y_[0]
+
+            # only the label key is set per dependent variable, a shallow copy suffices.
+            kwargs_ = dict(kwargs)
             # add a default label if not provided by the user.
-            if "label" not in kwargs_.keys():
+            if "label" not in kwargs_:
                 kwargs_["label"] = dv.name if one else _get_label_from_dv(dv, i)
                 if kwargs_["label"] != "":
                     legend = True
@@ -196,7 +221,7 @@ class CSDMAxes(plt.Axes):
             if fn == "scatter":
                 r_plt = super().scatter(x_, y_, *args, **kwargs_)
 
-        self.set_xlim(x[0].coordinates.value.min(), x[0].coordinates.value.max())
+        self.set_xlim(*_get_bounds(x[0], x_))
         self.set_xlabel(x[0].axis_label)
 
         ylabel = dv.axis_label[0] if one else "dimensionless"
@@ -228,17 +253,20 @@ class CSDMAxes(plt.Axes):
         r_plt = None
         for i, dv in enumerate(csdm.dependent_variables):
             y = dv.components
+            if len(y) != 1:
+                raise Exception(message_2D_scalar)
             if dv.quantity_type in ["scalar", "vector_1", "pixel_1"]:
                 if cmaps_bool:
                     kwargs["cmap"] = cmaps[i]
 
+                img = y[0]
                 if fn == "contour":
-                    r_plt = super().contour(x0, x1, y[0], *args, **kwargs)
+                    r_plt = super().contour(x0, x1, img, *args, **kwargs)
                 if fn == "contourf":
-                    r_plt = super().contourf(x0, x1, y[0], *args, **kwargs)
+                    r_plt = super().contourf(x0, x1, img, *args, **kwargs)
 
-        self.set_xlim(x0.min(), x0.max())
-        self.set_ylim(x1.min(), x1.max())
+        self.set_xlim(*_get_bounds(x[0], x0))
+        self.set_ylim(*_get_bounds(x[1], x1))
         self.set_xlabel(x[0].axis_label)
         self.set_ylabel(x[1].axis_label)
         if one:
@@ -270,18 +298,20 @@ class CSDMAxes(plt.Axes):
 
         r_plt = None
         for i, dv in enumerate(csdm.dependent_variables):
-            y = dv.components
-            if dv.quantity_type in ["scalar", "vector_1", "pixel_1"]:
+            # the quantity_type property returns a new copy on every access.
+            y, quantity_type = dv.components, dv.quantity_type
+            if len(y) not in image_component_counts:
+                raise Exception(message_2D_image)
+            if quantity_type in ["scalar", "vector_1", "pixel_1"]:
                 if cmaps_bool:
                     kwargs["cmap"] = cmaps[i]
 
-                r_plt = super().imshow(y[0], *args, **kwargs)
-
-            if dv.quantity_type == "pixel_3":
-                r_plt = super().imshow(np.moveaxis(y.copy(), 0, -1), *args, **kwargs)
+                img = y[0]
+                r_plt = super().imshow(img, *args, **kwargs)
 
-            if dv.quantity_type == "pixel_4":
-                r_plt = super().imshow(np.moveaxis(y.copy(), 0, -1), *args, **kwargs)
+            if quantity_type in ["pixel_3", "pixel_4"]:
+                img = np.ascontiguousarray(y.transpose(1, 2, 0))
+                r_plt = super().imshow(img, *args, **kwargs)
 
         self.set_xlabel(x[0].axis_label)
         self.set_ylabel(x[1].axis_label)
@@ -292,6 +322,51 @@ class CSDMAxes(plt.Axes):
             raise NotImplementedError("Cannot plot dataset")
         return r_plt
 
+    def _call_nonuniform_2D_image(self, csdm, **kwargs):
+        _check_2D_scalar_and_pixel_dataset(csdm)
+
+        x = csdm.dimensions
+        if any(dim.type == "labeled" for dim in x):
+            raise NotImplementedError("Image of labeled dimensions is not implemented.")
+        x0, x1 = x[0].coordinates.value, x[1].coordinates.value
+
+        if "interpolation" not in kwargs:
+            kwargs["interpolation"] = "nearest"
+
+        # add cmap for multiple dependent variables.
+        cmaps = kwargs.pop("cmaps", None)
+
+        r_plt = None
+        for i, dv in enumerate(csdm.dependent_variables):
+            y, quantity_type = dv.components, dv.quantity_type
+            if len(y) not in image_component_counts:
+                raise Exception(message_2D_image)
+            if cmaps is not None:
+                kwargs["cmap"] = cmaps[i]
+
+            # same quantity types as the uniform path, others are not drawn.
+            if quantity_type in ["scalar", "vector_1", "pixel_1"]:
+                img = y[0]
+            elif quantity_type in ["pixel_3", "pixel_4"]:
+                img = np.ascontiguousarray(y.transpose(1, 2, 0))
+            else:
+                continue
+            r_plt = NonUniformImage(self, **kwargs)
+            r_plt.set_data(x0, x1, img)
+            self.add_image(r_plt)
+
+        if r_plt is None:
+            raise NotImplementedError("Cannot plot dataset")
+
+        # the axis setup is done once for all dependent variables.
+        self.set_xlim(*_get_bounds(x[0], x0))
+        self.set_ylim(*_get_bounds(x[1], x1))
+        self.set_xlabel(x[0].axis_label)
+        self.set_ylabel(x[1].axis_label)
+        if len(csdm.dependent_variables) == 1:
+            self.set_title(dv.name)
+        return r_plt
+
 
 try:
     proj.register_projection(CSDMAxes)
@@ -299,55 +374,41 @@ except NameError:
     pass
 
 
-def _check_1D_dataset(csdm):
-    x, y = csdm.dimensions, csdm.dependent_variables
+def _get_bounds(dim, coordinates):
+    """Return the (min, max) bounds of the dimension coordinates. The bounds of a
+    linear dimension are its end points, other dimensions are scanned.
+    """
+    if dim.type == "linear":
+        return tuple(sorted((coordinates[0], coordinates[-1])))
+    return coordinates.min(), coordinates.max()
 
-    message = (
-        "The function requires a 1D dataset with single-component dependent "
-        "variables. For multiple dependent-variables, the data from all the "
-        "dependent variables are plotted on the same figure."
-    )
-    if len(x) != 1:
-        raise Exception(message)
-    for y_ in y:
-        if len(y_.components) != 1:
-            raise Exception(message)
 
+def _check_1D_dataset(csdm):
+    if len(csdm.dimensions) != 1:
+        raise Exception(message_1D)
 
-def _check_2D_scalar_and_pixel_dataset(csdm):
-    x, y = csdm.dimensions, csdm.dependent_variables
 
-    message = (
-        "The function requires a 2D dataset with a single-component (scalar), "
-        "three components (pixel_3), or four components (pixel_4) dependent "
-        "variables. The pixel_3 produces an RGB image while pixel_4, a RGBA image."
-    )
-    if len(x) != 2:
-        raise Exception(message)
-    for y_ in y:
-        if len(y_.components) not in [1, 3, 4]:
-            raise Exception(message)
+def _check_2D_scalar_and_pixel_dataset(csdm):
+    if len(csdm.dimensions) != 2:
+        raise Exception(message_2D_image)
 
 
 def _check_2D_scalar_dataset(csdm):
-    x, y = csdm.dimensions, csdm.dependent_variables
-
-    message = (
-        "The function requires a 2D dataset with a single-component (scalar), "
-        "dependent variables."
-    )
-    if len(x) != 2:
-        raise Exception(message)
-    for y_ in y:
-        if len(y_.components) != 1:
-            raise Exception(message)
+    if len(csdm.dimensions) != 2:
+        raise Exception(message_2D_scalar)
 
 
 # --------- cp plot functions ---------- #
 
 
-def _preview(data, reverse_axis=None, range_=None, **kwargs):
-    """Quick display of the data."""
+# number of _preview calls per figure, used to skip the redraws with disp_skip.
+_preview_calls = WeakKeyDictionary()
+
+
+def _preview(data, reverse_axis=None, range_=None, disp_skip=1, **kwargs):
+    """Quick display of the data. With disp_skip=n, the figure is only drawn on
+    every n-th call for the same figure, and is returned unchanged otherwise.
+    """
     if reverse_axis is not None:
         kwargs["reverse_axis"] = reverse_axis
 
@@ -357,7 +418,7 @@ def _preview(data, reverse_axis=None, range_=None, **kwargs):
     x = data.dimensions
     y = data.dependent_variables
     y_len = len(y)
-    y_grid = int(y_len / 2) + 1
+    y_grid = y_len // 2 + 1
 
     if len(x) == 0:
         raise NotImplementedError(
@@ -369,10 +430,16 @@ def _preview(data, reverse_axis=None, range_=None, **kwargs):
             "Preview of three or higher dimensional datasets " "is not implemented."
         )
 
-    if np.any([x[i].type == "labeled" for i in range(len(x))]):
+    if any(dim.type == "labeled" for dim in x):
         raise NotImplementedError("Preview of labeled dimensions is not implemented.")
 
+    # pyplot is only needed for the quick preview, so it is imported on first use.
+    import matplotlib.pyplot as plt
+
     fig = plt.gcf()
+    if _skip_preview(fig, disp_skip):
+        return fig
+
     if y_len <= 2:
         ax = fig.subplots(y_grid)
         ax = [[ax]] if y_len == 1 else [ax]
@@ -388,16 +455,26 @@ def _preview(data, reverse_axis=None, range_=None, **kwargs):
     return fig
 
 
+def _skip_preview(fig, disp_skip):
+    """Count the _preview calls on the figure and return True for the calls that are
+    not drawn, that is, all but every disp_skip-th call."""
+    if disp_skip <= 1:
+        return False
+    step = _preview_calls.get(fig, 0)
+    _preview_calls[fig] = step + 1
+    return step % disp_skip != 0
+
+
 def one_d_plots(ax, x, y, range_, **kwargs):
     """A collection of possible 1D plots."""
     for i, y_item in enumerate(y):
-        i0 = int(i / 2)
-        j0 = int(i % 2)
+        i0, j0 = divmod(i, 2)
         ax_ = ax[i0][j0]
 
-        if y_item.quantity_type in scalar:
+        quantity_type = y_item.quantity_type
+        if quantity_type in scalar:
             oneD_scalar(x, y_item, ax_, range_, **kwargs)
-        if "vector" in y_item.quantity_type:
+        if "vector" in quantity_type:
             vector_plot(x, y_item, ax_, range_, **kwargs)
         # if "audio" in y_item.quantity_type:
         #     audio(x, y, i, fig, ax, **kwargs)
@@ -406,35 +483,40 @@ def one_d_plots(ax, x, y, range_, **kwargs):
 def two_d_plots(ax, x, y, range_, **kwargs):
     """A collection of possible 2D plots."""
     for i, y_item in enumerate(y):
-        i0 = int(i / 2)
-        j0 = int(i % 2)
+        i0, j0 = divmod(i, 2)
         ax_ = ax[i0][j0]
 
-        if y_item.quantity_type == "pixel_3":
+        quantity_type = y_item.quantity_type
+        if quantity_type == "pixel_3":
             warn("This method interprets the `pixel_3` dataset as an RGB image.")
             RGB_image(x, y_item, ax_, range_, **kwargs)
 
-        if y_item.quantity_type in scalar:
+        if quantity_type in scalar:
             twoD_scalar(x, y_item, ax_, range_, **kwargs)
 
-        if "vector" in y_item.quantity_type:
+        if "vector" in quantity_type:
             vector_plot(x, y_item, ax_, range_, **kwargs)
 
 
 def oneD_scalar(x, y, ax, range_, **kwargs):
     reverse = [False]
-    if "reverse_axis" in kwargs.keys():
+    if "reverse_axis" in kwargs:
         reverse = kwargs["reverse_axis"]
         kwargs.pop("reverse_axis")
 
-    components = y.components.shape[0]
-    for k in range(components):
-        ax.plot(x[0].coordinates, y.components[k], **kwargs)
-        ax.set_xlim(x[0].coordinates.value.min(), x[0].coordinates.value.max())
-        ax.set_xlabel(f"{x[0].axis_label} - 0")
-        ax.set_ylabel(y.axis_label[0])
-        ax.set_title(f"{y.name}")
-        ax.grid(color="gray", linestyle="--", linewidth=0.5)
+    # evaluate the coordinates and their limits once for all components. Plain arrays
+    # are passed to matplotlib, the unit is part of the axis label.
+    x0 = x[0].coordinates.value
+    x0_min, x0_max = _get_bounds(x[0], x0)
+    components = y.components
+    for k in range(components.shape[0]):
+        ax.plot(x0, components[k], **kwargs)
+
+    ax.set_xlim(x0_min, x0_max)
+    ax.set_xlabel(f"{x[0].axis_label} - 0")
+    ax.set_ylabel(y.axis_label[0])
+    ax.set_title(f"{y.name}")
+    ax.grid(color="gray", linestyle="--", linewidth=0.5)
 
     ax.set_xlim(range_[0])
     ax.set_ylim(range_[1])
@@ -445,7 +527,7 @@ def oneD_scalar(x, y, ax, range_, **kwargs):
 
 def twoD_scalar(x, y, ax, range_, **kwargs):
     reverse = [False, False]
-    if "reverse_axis" in kwargs.keys():
+    if "reverse_axis" in kwargs:
         reverse = kwargs["reverse_axis"]
         kwargs.pop("reverse_axis")
 
@@ -453,18 +535,18 @@ def twoD_scalar(x, y, ax, range_, **kwargs):
     x1 = x[1].coordinates.value
     y00 = y.components[0]
     extent = [x0[0], x0[-1], x1[0], x1[-1]]
-    if "extent" not in kwargs.keys():
+    if "extent" not in kwargs:
         kwargs["extent"] = extent
 
     if x[0].type == "linear" and x[1].type == "linear":
-        if "origin" not in kwargs.keys():
+        if "origin" not in kwargs:
             kwargs["origin"] = "lower"
-        if "aspect" not in kwargs.keys():
+        if "aspect" not in kwargs:
             kwargs["aspect"] = "auto"
 
         cs = ax.imshow(y00, **kwargs)
     else:
-        if "interpolation" not in kwargs.keys():
+        if "interpolation" not in kwargs:
             kwargs["interpolation"] = "nearest"
 
         cs = NonUniformImage(ax, **kwargs)
@@ -492,32 +574,35 @@ def twoD_scalar(x, y, ax, range_, **kwargs):
 
 def vector_plot(x, y, ax, range_, **kwargs):
     reverse = [False, False]
-    if "reverse_axis" in kwargs.keys():
+    if "reverse_axis" in kwargs:
         reverse = kwargs["reverse_axis"]
         kwargs.pop("reverse_axis")
 
+    # the coordinates are evaluated once and reused for the grid and the limits.
     x0 = x[0].coordinates.value
     if len(x) == 2:
         x1 = x[1].coordinates.value
     else:
         x1 = np.zeros(1)
 
-    x0, x1 = np.meshgrid(x0, x1)
-    u1 = y.components[0]
-    v1 = y.components[1]
+    x0_grid, x1_grid = np.meshgrid(x0, x1)
+    components = y.components
+    u1 = components[0]
+    v1 = components[1]
 
-    if "pivot" not in kwargs.keys():
+    if "pivot" not in kwargs:
         kwargs["pivot"] = "middle"
-    ax.quiver(x0, x1, u1, v1, **kwargs)
+    ax.quiver(x0_grid, x1_grid, u1, v1, **kwargs)
     ax.set_xlabel(f"{x[0].axis_label} - 0")
-    ax.set_xlim(x[0].coordinates.value.min(), x[0].coordinates.value.max())
+    ax.set_xlim(*_get_bounds(x[0], x0))
     if len(x) == 2:
-        ax.set_ylim(x[1].coordinates.value.min(), x[1].coordinates.value.max())
+        ax.set_ylim(*_get_bounds(x[1], x1))
         ax.set_ylabel(f"{x[1].axis_label} - 1")
         if reverse[1]:
             ax.invert_yaxis()
     else:
-        ax.set_ylim([-y.components.max(), y.components.max()])
+        y_max = components.max()
+        ax.set_ylim([-y_max, y_max])
     ax.set_title(f"{y.name}")
     ax.grid(color="gray", linestyle="--", linewidth=0.5)
 
@@ -530,12 +615,19 @@ def vector_plot(x, y, ax, range_, **kwargs):
 
 def RGB_image(x, y, ax, range_, **kwargs):
     reverse = [False, False]
-    if "reverse_axis" in kwargs.keys():
+    if "reverse_axis" in kwargs:
         reverse = kwargs["reverse_axis"]
         kwargs.pop("reverse_axis")
 
     y0 = y.components
-    ax.imshow(np.moveaxis(y0 / y0.max(), 0, -1), **kwargs)
+    scale = 1.0 / y0.max()
+    if y0.dtype.kind in "iub":
+        # integer images are scaled in single precision, in-place on the cast copy.
+        scaled = y0.astype(np.float32)
+        scaled *= scale
+    else:
+        scaled = y0 * scale
+    ax.imshow(np.ascontiguousarray(scaled.transpose(1, 2, 0)), **kwargs)
     ax.set_title(f"{y.name}")
 
     ax.set_xlim(range_[0])
@@ -1,5 +1,4 @@
 """Helper methods for CSDM class."""
-from copy import deepcopy
 
 import numpy as np
 from astropy.units.quantity import Quantity
@@ -68,8 +67,7 @@ class QuantityType:
 
     def __eq__(self, other):
         """Overrides the default implementation"""
-        check = [self.value == other.value, self.p == other.p]
-        return False if False in check else True
+        return self.value == other.value and self.p == other.p
 
     def update(self, element):
         """Update the quantity type."""
@@ -172,8 +170,7 @@ class NumericType:
 
     def __eq__(self, other):
         """Overrides the default implementation"""
-        check = [self.value == other.value, self.dtype == other.dtype]
-        return False if False in check else True
+        return self.value == other.value and self.dtype == other.dtype
 
     def _check_numeric_type(self, element):
         if isinstance(element, np.dtype):
@@ -187,7 +184,7 @@ class NumericType:
             return
 
         lst = self.__class__._lst
-        if element not in lst.keys():
+        if element not in lst:
             literals = self.__class__.literals
             message = (
                 f"The value, `{element}`, is an invalid `numeric_type` enumeration "
@@ -353,35 +350,33 @@ def _get_broadcast_shape(array, ndim, axis):
     return array[tuple(s)]
 
 
+_INDEX_TYPE_MESSAGE = "Index/Indices are expected as integer(s)"
+
+
 def _check_dimension_indices(d, index=-1):
     """Check the list of indexes to ensure that each index is an integer
     and within the counts of dimensions.
     """
-    index = deepcopy(index)
-
-    def _correct_index(i, d):
-        if not isinstance(i, int):
-            raise TypeError(f"{message}, found {type(i)}")
-        if i < 0:
-            i += d
-        if i > d:
-            raise IndexError(
-                f"The `index` {index} cannot be greater than the total number of "
-                f"dimensions - 1, {d}."
-            )
-        return -1 - i
-
-    message = "Index/Indices are expected as integer(s)"
-    # convert to list and correct the list elements in the following section.
-    if isinstance(index, tuple):
-        index = list(index)
-    if isinstance(index, (tuple, list, np.ndarray)):
-        for i, item in enumerate(index):
-            index[i] = _correct_index(item, d)
-        return tuple(index)
+    # fast path for the common single integer index.
     if isinstance(index, int):
-        return _correct_index(index, d)
-    raise TypeError(f"{message}, found {type(index)}")
+        return _correct_dimension_index(index, index, d)
+    if isinstance(index, (tuple, list, np.ndarray)):
+        return tuple(_correct_dimension_index(item, index, d) for item in index)
+    raise TypeError(f"{_INDEX_TYPE_MESSAGE}, found {type(index)}")
+
+
+def _correct_dimension_index(i, index, d):
+    """Return the reversed position of the integer dimension index i."""
+    if not isinstance(i, int):
+        raise TypeError(f"{_INDEX_TYPE_MESSAGE}, found {type(i)}")
+    if i < 0:
+        i += d
+    if i > d:
+        raise IndexError(
+            f"The `index` {index} cannot be greater than the total number of "
+            f"dimensions - 1, {d}."
+        )
+    return -1 - i
 
 
 def np_check_for_out(csdm, **kwargs):
@@ -403,10 +398,10 @@ def get_CSDM_object__args__axes(*args, **kwargs):
         if len(args) > 1:
             args_[0] = _check_dimension_indices(len(csdm.dimensions), args[1])
             axis = args_[0]
-    if "a" in kwargs.keys():
+    if "a" in kwargs:
         csdm = kwargs["a"]
         kwargs.pop("a")
-    if "axis" in kwargs.keys():
+    if "axis" in kwargs:
         if kwargs["axis"] is not None:
             axis = _check_dimension_indices(len(csdm.dimensions), kwargs["axis"])
             kwargs["axis"] = axis
@@ -19,7 +19,7 @@ required = [
     "requests>=2.21.0",
     "numexpr>=2.7.0",
 ]
-extras = {"matplotlib": ["matplotlib>=3.0"]}
+extras = {"matplotlib": ["matplotlib>=3.0"], "orjson": ["orjson>=3.0"]}
 setup_requires = ["setuptools>=27.3"]
 
 here = os.path.abspath(os.path.dirname(__file__))
@@ -14,6 +14,10 @@ def test_csdm_new():
     with pytest.raises(ValueError, match=f".*{error}.*"):
         a.dimensions[0] = np.arange(5)
 
+    with pytest.raises(ValueError, match=f".*{error}.*"):
+        a.dimensions += [cp.as_dimension(np.arange(5)), np.arange(5)]
+    assert len(a.dimensions) == 1
+
     error = "Deleting items is not allowed"
     with pytest.raises(LookupError, match=f".*{error}.*"):
         del a.dimensions[0]
@@ -28,6 +32,15 @@ def test_csdm_new():
     }
 
 
+def test_contiguous_components():
+    dv = cp.as_dependent_variable(np.arange(20.0)[::2])
+    assert not dv.components.flags.c_contiguous
+    dims = [cp.as_dimension(np.arange(5)), cp.as_dimension(np.arange(2))]
+    a = cp.CSDM(dimensions=dims, dependent_variables=[dv])
+    assert a.y[0].components.flags.c_contiguous
+    assert np.allclose(a.y[0].components, np.arange(20.0)[::2].reshape(1, 2, 5))
+
+
 def test_bad_csdm():
     error = "A list of valid Dimension or equivalent dictionary objects"
     with pytest.raises(ValueError, match=f".*{error}.*"):
@@ -6,6 +6,7 @@
     5) min, max, clip, real, imag, conj, round, angle functions.
 """
 import json
+import re
 
 import numpy as np
 import pytest
@@ -107,6 +108,13 @@ def test_csdm():
 
     assert data.dict(read_only=True) == structure
 
+    # data_structure falls back to the json module when orjson is unavailable
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(cp.csdm, "orjson", None)
+        assert data.data_structure == str(
+            json.dumps(structure, ensure_ascii=False, sort_keys=False, indent=2)
+        )
+
     # equality check
     new_data = data.copy()
 
@@ -118,6 +126,58 @@ def test_csdm():
     assert new_data != data
 
 
+def test_shallow_copy():
+    data = b1_test.copy()
+    new = data.copy(deep=False)
+    assert new == data
+    assert new.y[0].components is data.y[0].components
+
+    new.y[0].component_labels = ["new"]
+    assert data.y[0].component_labels == [""]
+
+    new = data.astype("float32")
+    assert str(new.y[0].numeric_type) == "float32"
+    assert str(data.y[0].numeric_type) == "int64"
+
+    new = data.astype("int64")
+    assert new == data
+    new.y[0].components[0, 0] = -10
+    assert data.y[0].components[0, 0] == 0
+
+
+def test_copy_for_arithmetic():
+    data = b1_test.copy()
+    data.tags = ["a"]
+    data.application = {"csdmpy": {"a": 1}}
+    data.y[0].application = {"b": [1, 2]}
+
+    new = data._copy_for_arithmetic()
+    assert new == data
+    assert new.timestamp == data.timestamp
+
+    new.tags.append("b")
+    new.application["csdmpy"]["a"] = 2
+    new.dimensions[0].label = "new"
+    new.y[0].components[0, 0] = -10
+    new.y[0].application["b"].append(3)
+    new.y[0].component_labels = ["new"]
+    new.y[1].numeric_type = "complex64"
+    assert data.tags == ["a"]
+    assert data.application == {"csdmpy": {"a": 1}}
+    assert data.dimensions[0].label == ""
+    assert data.y[0].components[0, 0] == 0
+    assert data.y[0].application == {"b": [1, 2]}
+    assert data.y[0].component_labels == [""]
+    assert str(data.y[1].numeric_type) == "int64"
+
+
+def test_timestamp():
+    data = cp.new()
+    timestamp = data.to_dict(update_timestamp=True)["csdm"]["timestamp"]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", timestamp)
+    assert data.to_dict()["csdm"].get("timestamp") is None
+
+
 def test_split():
     set_1 = cp.CSDM(
         dimensions=[cp.LinearDimension(count=10, increment="1m")],
@@ -245,6 +305,17 @@ def test_add_sub():
 
     res = cp.ScalarQuantity("2m") - a_test
     assert np.allclose(res.y[0].components, [-out])
+    assert np.allclose(a_test.y[0].components, [np.arange(10)])
+
+    # same, but not identical, composite units
+    c_test = b_test / cp.ScalarQuantity("1 s")
+    d_test = b_test / cp.ScalarQuantity("1 s")
+    assert c_test.y[0].unit is not d_test.y[0].unit
+    res = c_test + d_test
+    assert np.allclose(res.y[0].components, [2 * np.arange(10)])
+    assert str(res.y[0].unit) == "km / s"
+    res -= d_test
+    assert np.allclose(res.y[0].components, [np.arange(10)])
 
     error = r"Cannot operate on CSDM objects with different dimensions."
     with pytest.raises(Exception, match=f".*{error}.*"):
@@ -255,6 +326,56 @@ def test_add_sub():
         res = a_test + b1_test
 
 
+def test_add_sub_multiple_components():
+    for dtype in ["float64", "float32", "int64", "complex128"]:
+        comp = np.arange(20).reshape(2, 10).astype(dtype)
+        a_t = cp.as_csdm(comp, quantity_type="vector_2")
+        res = a_t + a_t
+        assert np.allclose(res.y[0].components, 2 * comp)
+        res = a_t - a_t
+        assert np.allclose(res.y[0].components, 0)
+        assert np.allclose(a_t.y[0].components, comp)
+
+    # the sum of two integer csdm objects is a float array.
+    a_t = cp.as_csdm(np.arange(10))
+    assert (a_t + a_t).y[0].components.dtype == np.float64
+    assert (a_t - a_t).y[0].components.dtype == np.float64
+    assert (a_t + 1).y[0].components.dtype == a_t.y[0].components.dtype
+
+
+def test_sub_integer_scalar():
+    # unsigned components are promoted to a signed type rather than wrapping around.
+    a_t = cp.as_csdm(np.arange(5, dtype="uint8"))
+    res = a_t - 2
+    assert res.y[0].components.dtype == np.int16
+    assert np.array_equal(res.y[0].components, [[-2, -1, 0, 1, 2]])
+    assert np.array_equal(a_t.y[0].components, [np.arange(5)])
+
+    a_t = cp.as_csdm(np.array([-128, -127, 0, 126, 127], dtype="int8"))
+    res = a_t - 2
+    assert res.y[0].components.dtype == np.int8
+    assert np.array_equal(res.y[0].components[0, 2:], [-2, 124, 125])
+    res = a_t - 200
+    assert res.y[0].components.dtype == np.int16
+    assert np.array_equal(res.y[0].components, [[-328, -327, -200, -74, -73]])
+
+
+def test_rsub_integer_scalar():
+    # integer differences are negated to float, as in -csdm.
+    out = [[2, 1, 0, -1, -2]]
+    for dtype in ["uint8", "int64"]:
+        a_t = cp.as_csdm(np.arange(5, dtype=dtype))
+        res = 2 - a_t
+        assert res.y[0].components.dtype == np.float64
+        assert np.array_equal(res.y[0].components, out)
+        assert (-a_t).y[0].components.dtype == np.float64
+
+    a_t = cp.as_csdm(np.arange(5, dtype="float32"))
+    res = 2 - a_t
+    assert res.y[0].components.dtype == np.float32
+    assert np.array_equal(res.y[0].components, out)
+
+
 def test_iadd_isub():
     res = a_test.astype("float32")
     res += cp.ScalarQuantity("5.0cm")
@@ -266,6 +387,16 @@ def test_iadd_isub():
     out = np.arange(10) - 0.05
     assert np.allclose(res.y[0].components, [out])
 
+    res = a_test.astype("float32")
+    res += np.arange(10) * cp.ScalarQuantity("1 m").quantity
+    out = 2 * np.arange(10)
+    assert np.allclose(res.y[0].components, [out])
+
+    res = a_test.astype("float32")
+    res -= np.arange(10) * cp.ScalarQuantity("1 cm").quantity
+    out = 0.99 * np.arange(10)
+    assert np.allclose(res.y[0].components, [out])
+
     res = a_test.astype("float32") / cp.ScalarQuantity("cm")
     res -= 0.05
     out = np.arange(10) - 0.05
@@ -287,6 +418,29 @@ def test_iadd_isub():
     out -= 1000 * np.arange(10)
     assert np.allclose(new_test.y[0].components, [out])
 
+    out, new_test = get_test(float)  # in units of m
+    out_other, other_test = get_test(float)  # same unit
+    new_test += other_test
+    out += out_other
+    assert np.allclose(new_test.y[0].components, [out])
+    assert np.allclose(other_test.y[0].components, [out_other])
+
+
+def test_iadd_isub_numexpr(monkeypatch):
+    monkeypatch.setattr(cp.csdm.ne, "nthreads", 2)
+    monkeypatch.setattr(cp.csdm, "_NUMEXPR_MIN_SIZE", 1)
+
+    for np_type in [float, complex]:
+        out, new_test = get_test(np_type)  # in units of m
+        new_test += b_test.astype(np_type)
+        out += 1000 * np.arange(10)
+        assert np.allclose(new_test.y[0].components, [out])
+
+        out, new_test = get_test(np_type)  # in units of m
+        new_test -= b_test.astype(np_type)
+        out -= 1000 * np.arange(10)
+        assert np.allclose(new_test.y[0].components, [out])
+
 
 def test_mul_truediv_pow():
     # mul
@@ -383,6 +537,7 @@ def test_mul_truediv_pow():
 
     res = cp.ScalarQuantity("1.324 s") / (b_test + 1)
     assert np.allclose(res.y[0].components, 1.324 / (out + 1))
+    assert str(res.y[0].unit) == "s / km"
 
     error = r"unsupported operand type\(s\) \*: 'CSDM' and 'str'."
     with pytest.raises(TypeError, match=f".*{error}.*"):
@@ -529,6 +684,12 @@ def test_max_min_clip():
     res = new_test.clip(max=0.5)
     assert np.allclose(out.clip(max=0.5), res.y[0].components[0])
 
+    res = new_test.clip(min=0.2, max=0.5)
+    assert np.allclose(out.clip(0.2, 0.5), res.y[0].components[0])
+
+    res = new_test.clip()
+    assert np.allclose(out, res.y[0].components[0])
+
 
 def test_real_imag_conj_angle():
     out, new_test = get_test_2d(complex)
@@ -612,6 +773,17 @@ def test_reshape():
     new_test = test_csdm.reshape(shape=(d1, d2))
     np.testing.assert_allclose(new_test.y[0].components[0], out.reshape(25, 2))
 
+    test_csdm = cp.CSDM(
+        dimensions=test_csdm.dimensions,
+        dependent_variables=[test_csdm.y[0], test_csdm.y[0].copy()],
+    )
+    test_csdm.y[1].name = "second"
+    new_test = test_csdm.reshape(shape=(-1, 2))
+    assert new_test.shape == (25, 2)
+    assert len(new_test.y) == 2
+    assert new_test.y[1].name == "second"
+    np.testing.assert_allclose(new_test.y[1].components[0], out.reshape(2, 25))
+
 
 def test_neg_to_pos_inc1():
     x = [
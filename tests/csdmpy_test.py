@@ -37,3 +37,62 @@ def test_join():
     error = "Cannot join CSDM objects with different dimensions"
     with pytest.raises(Exception, match=f".*{error}.*"):
         _ = cp.join([obj, obj5])
+
+
+def test_plot_disp_skip():
+    import matplotlib.pyplot as plt
+
+    data = cp.as_csdm(np.arange(10.0))
+    fig = plt.figure()
+    n_axes = []
+    for _ in range(5):
+        cp.plot(data, disp_skip=2)
+        n_axes.append(len(fig.axes))
+    plt.close(fig)
+    assert n_axes == [1, 1, 2, 2, 3]
+
+
+def test_plot_image_large_offset():
+    import matplotlib.pyplot as plt
+
+    # float64 images are drawn at full precision, distinct values on a large offset
+    # map to distinct colors.
+    data = cp.as_csdm(1e9 + np.arange(12.0).reshape(3, 4))
+    fig = plt.figure()
+    cp.plot(data)
+    ax = plt.subplot(projection="csdm")
+    images = [fig.axes[0].get_images()[0], ax.imshow(data)]
+    for image in images:
+        array = image.get_array()
+        assert array.dtype == np.float64
+        colors = image.to_rgba(array).reshape(-1, 4)
+        assert np.unique(colors, axis=0).shape[0] == 12
+    plt.close(fig)
+
+
+def test_plot_nonuniform_image():
+    import matplotlib.pyplot as plt
+    from matplotlib.image import NonUniformImage
+
+    dims = [cp.as_dimension(np.array([1.0, 2, 4, 8])), cp.as_dimension(np.arange(3))]
+    fig = plt.figure()
+    ax = plt.subplot(projection="csdm")
+
+    scalar = cp.as_csdm(np.arange(12.0).reshape(3, 4))
+    data = cp.CSDM(dimensions=dims, dependent_variables=scalar.y)
+    image = ax.imshow(data)
+    assert isinstance(image, NonUniformImage)
+    assert image.get_array().shape == (3, 4)
+    assert ax.get_xlim() == (1.0, 8.0)
+
+    rgb = cp.as_csdm(np.random.rand(3, 3, 4), quantity_type="pixel_3")
+    data = cp.CSDM(dimensions=dims, dependent_variables=rgb.y)
+    image = ax.imshow(data)
+    assert isinstance(image, NonUniformImage)
+    assert image.get_array().shape == (3, 4, 3)
+
+    vector = cp.as_csdm(np.random.rand(3, 3, 4), quantity_type="vector_3")
+    data = cp.CSDM(dimensions=dims, dependent_variables=vector.y)
+    with pytest.raises(NotImplementedError, match=".*Cannot plot dataset.*"):
+        ax.imshow(data)
+    plt.close(fig)
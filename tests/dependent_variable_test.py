@@ -298,3 +298,41 @@ def test_c_f_contiguous_array():
     dv_f = cp.as_dependent_variable(arr_f)
 
     assert np.allclose(dv_c.components, dv_f.components)
+
+
+def test_from_existing():
+    d_v = cp.as_dependent_variable(
+        np.arange(10, dtype=np.float32), unit="m", name="test", component_labels=["x"]
+    )
+    components = np.ones((1, 10), dtype=np.complex128)
+    new = cp.DependentVariable._from_existing(d_v, components)
+
+    assert new.components is components
+    assert new.numeric_type == "complex128"
+    assert d_v.numeric_type == "float32"
+    assert new.unit == d_v.unit
+    assert new.name == "test"
+    assert new.quantity_type == d_v.quantity_type
+
+    new.component_labels = ["y"]
+    assert d_v.component_labels == ["x"]
+
+
+def test_dict_unit():
+    d_v = cp.as_dependent_variable(np.arange(10.0), unit="m/s")
+    assert d_v.to_dict()["unit"] == "m * s^-1"
+    assert d_v.to_dict()["unit"] == "m * s^-1"
+
+    d_v = cp.as_dependent_variable(np.arange(10.0))
+    assert "unit" not in d_v.to_dict()
+
+
+def test_reduced_display():
+    d_v = cp.as_dependent_variable(np.arange(12.0))
+    expected = [["0.0, 1.0, ..., 10.0, 11.0"]]
+    assert d_v._dict(for_display=True)["components"] == expected
+
+    components = np.arange(12.0).reshape(4, 3).T[np.newaxis]
+    d_v = cp.DependentVariable._from_existing(d_v, components)
+    expected = [["0.0, 3.0, ..., 8.0, 11.0"]]
+    assert d_v._dict(for_display=True)["components"] == expected
@@ -705,3 +705,43 @@ def test_dimension_scale():
     assert np.allclose(dim2.coordinates.value, np.arange(10) / 2.4)
     assert dim2.quantity_name == "length"
     assert type(dim2.quantity_name) is str
+
+
+def test_shallow_copy():
+    dims = [
+        cp.Dimension(type="linear", count=10, increment="1 s", application={"a": 1}),
+        cp.LinearDimension(count=10, increment="1 s"),
+        cp.MonotonicDimension(coordinates=["1 m", "2 m", "4 m"]),
+        cp.LabeledDimension(labels=["a", "b", "c"]),
+    ]
+    for dim in dims:
+        new = dim._shallow_copy()
+        assert new == dim
+        assert type(new) is type(dim)
+        new.label = "new"
+        assert dim.label == ""
+
+    dim, new = dims[0], dims[0]._shallow_copy()
+    new.application["a"] = 2
+    new.reciprocal.coordinates_offset = "1 Hz"
+    new *= 2
+    assert dim.application == {"a": 1}
+    assert str(dim.reciprocal.coordinates_offset) == "0.0 1 / s"
+    assert str(dim.increment) == "1.0 s"
+    assert np.allclose(dim.coordinates.value, np.arange(10))
+
+    dim, new = dims[2], dims[2]._shallow_copy()
+    new /= 2
+    assert np.allclose(dim.coordinates.value, [1, 2, 4])
+
+    dim, new = dims[3], dims[3]._shallow_copy()
+    new.labels[1] = "q"
+    assert dim.labels.tolist() == ["a", "b", "c"]
+
+    a_t = cp.CSDM(
+        dimensions=[cp.Dimension(type="labeled", labels=["a", "b"])],
+        dependent_variables=[cp.as_dependent_variable(np.arange(2.0))],
+    )
+    res = a_t + 1
+    res.x[0].labels[1] = "q"
+    assert a_t.x[0].labels.tolist() == ["a", "b"]
@@ -85,3 +85,22 @@ def test_exp():
     test_cp = cp.apodize.exp(obj, "-0.1 m^-1", dimension=1)
     test_np = np.exp(-0.1 * np.arange(10)) * data[:, 0]
     assert np.allclose(test_np, test_cp.y[0].components[0][:, 0])
+
+
+def test_multiple_dependent_variables():
+    """apodization of multiple dependent variables"""
+    dv2 = {
+        "type": "internal",
+        "components": [2 * data.ravel()],
+        "quantity_type": "scalar",
+    }
+    dv3 = {"type": "internal", "components": [data.ravel().astype(np.float32)]}
+    dv3["quantity_type"] = "scalar"
+    dim3 = {"type": "linear", "count": 10, "increment": "1 s"}
+    test_np = np.exp(-np.arange(5))[None, :] * np.exp(-np.arange(10))[:, None] * data
+    for dvs in [[dv, dv2], [dv, dv2, dv3]]:
+        obj2 = cp.CSDM(dimensions=[dim1, dim3], dependent_variables=dvs)
+        test_cp = cp.apodize.exp(obj2, "-1 s^-1", dimension=(0, 1))
+        for i, factor in enumerate([1, 2, 1][: len(dvs)]):
+            assert np.allclose(test_cp.y[i].components[0], factor * test_np)
+            assert test_cp.y[i].components.dtype == np.float64
@@ -84,3 +84,6 @@ def test_transpose():
         test_1.y[0].components[0], np.transpose(obj_1.y[0].components[0], (1, 0, 2))
     )
     assert test_1.shape == (3, 4, 2)
+
+    test_1.dimensions.append(cp.Dimension(type="linear", count=1, increment="1"))
+    assert test_1.shape == (3, 4, 2, 1)
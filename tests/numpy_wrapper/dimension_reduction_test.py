@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 import csdmpy as cp
+from csdmpy.utils import _check_dimension_indices
 
 data = np.random.rand(50 * 15).reshape(15, 5, 10)
 dim = [
@@ -30,6 +31,14 @@ def test_exceptions():
         test_1.sum(axis=4)
 
 
+def test_check_dimension_indices():
+    assert _check_dimension_indices(3, 0) == -1
+    assert _check_dimension_indices(3, -1) == -3
+    index = [0, -1]
+    assert _check_dimension_indices(3, index) == (-1, -3)
+    assert index == [0, -1]
+
+
 def test_sum_cumsum():
     dimensions = [0, 1, 2]
     i = [[1, 2], [0, 2], [0, 1]]
@@ -185,6 +185,16 @@ def test_conjugate():
     assert np.allclose(res.y[0].components[0], np.conjugate(data2))
 
 
+def test_unscaled_components():
+    res = np.negative(test_1)
+    assert not np.shares_memory(res.y[0].components, test_1.y[0].components)
+
+    test_int = cp.as_csdm(np.arange(10))
+    res = np.negative(test_int)
+    assert res.y[0].numeric_type == "float64"
+    assert np.allclose(res.y[0].components[0], -np.arange(10))
+
+
 # -----------------------------------------------------------------
 # test for ufunc that also apply to the unit of dependent variables.
 # __ufunc_list_applies_to_unit__
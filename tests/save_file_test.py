@@ -1,5 +1,10 @@
+import json
+from io import StringIO
 from os import remove
 
+import numpy as np
+import pytest
+
 import csdmpy as cp
 
 
@@ -36,3 +41,103 @@ def test_csdfe():
     data.save("my_file_raw.csdfe")
     remove("my_file_raw.csdfe")
     remove("my_file_raw_0.dat")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_csdf_json_encoding(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(cp.csdm, "orjson", None)
+    data = setup()
+    data.y[0].encoding = "none"
+    assert json.loads(data.dumps()) == data.to_dict()
+
+    data.save("my_file_json.csdf")
+    new_data = cp.load("my_file_json.csdf")
+    remove("my_file_json.csdf")
+    assert new_data.dimensions == data.dimensions
+    assert np.allclose(new_data.y[0].components, data.y[0].components)
+    assert new_data.dimensions[0].labels[0] == "🍈"
+
+    data.y[0].components[0, 0] = np.nan
+    with pytest.raises(ValueError, match=".*not JSON compliant.*"):
+        data.save("my_file_nan.csdf")
+    with pytest.raises(ValueError, match=".*not JSON compliant.*"):
+        data.dumps()
+
+
+def test_csdf_json_null_text(monkeypatch):
+    if cp.csdm.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    def json_dumps(*args, **kwargs):
+        raise AssertionError("serialized with the json module")
+
+    # a null in the text does not send finite data to the json module.
+    data = setup()
+    data.description = "null"
+    data.y[0].encoding = "none"
+    monkeypatch.setattr(cp.csdm.json, "dumps", json_dumps)
+    device = StringIO()
+    data.save(output_device=device)
+    assert '"description":"null"' in data.dumps()
+    assert '"description":"null"' in device.getvalue()
+
+    data.y[0].components[0, 0] = np.inf
+    with pytest.raises(AssertionError, match=".*json module.*"):
+        data.dumps()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_csdf_indent(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(cp.csdm, "orjson", None)
+    data = setup()
+    for indent, start in [(0, '{"csdm":{'), (2, '{\n  "csdm"'), (4, '{\n    "csdm"')]:
+        device = StringIO()
+        data.save(output_device=device, indent=indent)
+        assert device.getvalue().startswith(start)
+        assert json.loads(device.getvalue())["csdm"]["description"] == (
+            "An emoji dataset"
+        )
+
+
+def test_csdf_output_device():
+    data = setup()
+    device = StringIO()
+    data.save(output_device=device)
+    assert json.loads(device.getvalue())["csdm"]["dimensions"] == [
+        data.dimensions[0].to_dict()
+    ]
+
+
+def test_csdfe_multiple_binary_files():
+    d_y = setup().y[0]
+    d_y.encoding = "raw"
+    variables = [d_y.copy() for _ in range(3)]
+    for i, dv in enumerate(variables):
+        dv.components = dv.components * (i + 1)
+    data = cp.CSDM(dimensions=setup().dimensions, dependent_variables=variables)
+    data.save("my_file_raw_multi.csdfe")
+
+    new_data = cp.load("my_file_raw_multi.csdfe")
+    remove("my_file_raw_multi.csdfe")
+    for i in range(3):
+        remove(f"my_file_raw_multi_{i}.dat")
+        assert np.allclose(new_data.y[i].components, data.y[i].components)
+
+
+def test_csdfe_binary_components():
+    data = setup()
+    data.y[0].encoding = "base64"
+    data.save("my_file_binary.csdfe", binary_components=True)
+    assert data.y[0].encoding == "base64"
+
+    with open("my_file_binary.csdfe") as file:
+        content = json.load(file)["csdm"]["dependent_variables"][0]
+    assert content["components_url"] == "file:./my_file_binary_0.dat"
+    assert "components" not in content
+
+    new_data = cp.load("my_file_binary.csdfe")
+    remove("my_file_binary.csdfe")
+    remove("my_file_binary_0.dat")
+    assert np.allclose(new_data.y[0].components, data.y[0].components)